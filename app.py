@@ -1,4 +1,5 @@
 import os
+import time
 import streamlit as st
 from datetime import datetime
 
@@ -191,9 +192,14 @@ if "chat" not in st.session_state:
 def score(p):
     return p.get("confidence", 0)
 
+# PICKS is constant for the life of the server process, and Streamlit
+# re-executes this script on every rerun — cache both views process-wide
+# instead of re-sorting each time.
+@st.cache_resource
 def top3():
     return sorted(PICKS, key=lambda x: score(x), reverse=True)[:3]
 
+@st.cache_resource
 def forced_one_per_game():
     by_game = {}
     for p in PICKS:
@@ -236,6 +242,34 @@ def scotty_answer(p, q):
 - If timing changes → act early or pass. No chasing.
 """.strip()
 
+# The Q&A panel only depends on the selected pick and its own chat history,
+# so run it as a fragment: its buttons/chat input rerun just this panel
+# instead of the whole page.
+@st.fragment
+def scotty_panel(p):
+    c1, c2, c3 = st.columns(3)
+    if c1.button("Explain edge"):
+        q = "Explain the edge in 3 bullets and what matters most."
+        st.session_state.chat.append(("user", q))
+        st.session_state.chat.append(("assistant", scotty_answer(p, q)))
+    if c2.button("What kills it?"):
+        q = "What kills this bet and how do we defend?"
+        st.session_state.chat.append(("user", q))
+        st.session_state.chat.append(("assistant", scotty_answer(p, q)))
+    if c3.button("Sizing + timing"):
+        q = "Give sizing + timing rules and when we pass."
+        st.session_state.chat.append(("user", q))
+        st.session_state.chat.append(("assistant", scotty_answer(p, q)))
+
+    user_msg = st.chat_input("Ask Scotty about this pick… (scenarios, hedges, timing, price limits)")
+    if user_msg:
+        st.session_state.chat.append(("user", user_msg))
+        st.session_state.chat.append(("assistant", scotty_answer(p, user_msg)))
+
+    for role, content in st.session_state.chat[-12:]:
+        with st.chat_message("user" if role == "user" else "assistant"):
+            st.markdown(content)
+
 # ============================================================
 # SIDEBAR
 # ============================================================
@@ -253,7 +287,13 @@ with st.sidebar:
 # ============================================================
 # TOPBAR
 # ============================================================
-stamp = datetime.now().strftime("%b %d, %Y • %I:%M %p")
+# Reruns arrive in bursts (every widget click); reuse the last stamp for up
+# to a second instead of re-formatting it on each one.
+now_ts = time.monotonic()
+if now_ts - st.session_state.get("_stamp_ts", 0.0) > 1.0 or "_stamp" not in st.session_state:
+    st.session_state._stamp = datetime.now().strftime("%b %d, %Y • %I:%M %p")
+    st.session_state._stamp_ts = now_ts
+stamp = st.session_state._stamp
 st.markdown(f"""
 <div class="topbar">
   <div class="title">Account <span class="pill" style="margin-left:8px;">Simulated Data</span></div>
@@ -348,28 +388,7 @@ with right:
             st.write(p["execution"])
 
         with tab2:
-            c1, c2, c3 = st.columns(3)
-            if c1.button("Explain edge"):
-                q = "Explain the edge in 3 bullets and what matters most."
-                st.session_state.chat.append(("user", q))
-                st.session_state.chat.append(("assistant", scotty_answer(p, q)))
-            if c2.button("What kills it?"):
-                q = "What kills this bet and how do we defend?"
-                st.session_state.chat.append(("user", q))
-                st.session_state.chat.append(("assistant", scotty_answer(p, q)))
-            if c3.button("Sizing + timing"):
-                q = "Give sizing + timing rules and when we pass."
-                st.session_state.chat.append(("user", q))
-                st.session_state.chat.append(("assistant", scotty_answer(p, q)))
-
-            user_msg = st.chat_input("Ask Scotty about this pick… (scenarios, hedges, timing, price limits)")
-            if user_msg:
-                st.session_state.chat.append(("user", user_msg))
-                st.session_state.chat.append(("assistant", scotty_answer(p, user_msg)))
-
-            for role, content in st.session_state.chat[-12:]:
-                with st.chat_message("user" if role == "user" else "assistant"):
-                    st.markdown(content)
+            scotty_panel(p)
 
         st.markdown("</div>", unsafe_allow_html=True)
 
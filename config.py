@@ -4,6 +4,7 @@ Configuration & Settings
 """
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict
 
 # ─────────────────────────────────────────────
@@ -17,19 +18,30 @@ DISCORD_CHANNEL_ID = int(os.getenv("DISCORD_CHANNEL_ID", "0"))
 # DATABASE
 # ─────────────────────────────────────────────
 DB_PATH = os.path.join(os.path.dirname(__file__), "db", "edge_intel.db")
+REPORT_CACHE_TTL = 30               # seconds a performance report is reused; writes invalidate it
+
+# ─────────────────────────────────────────────
+# HTTP RESPONSE CACHE (on disk, survives restarts)
+# ─────────────────────────────────────────────
+HTTP_CACHE_DIR = os.path.join(os.path.dirname(__file__), ".cache", "http")
+HTTP_CACHE_MAX_AGE = 7 * 24 * 3600  # files older than this are swept; date-ranged keys never repeat
 
 # ─────────────────────────────────────────────
 # TIME-WEIGHTED RATING MODEL
 # Weights must sum to 1.0
 # Tune these after backtesting — start conservative
 # ─────────────────────────────────────────────
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RatingWeights:
     season: float = 0.55
     last_15: float = 0.25
     last_5: float = 0.15
     last_game: float = 0.05
 
+    def __post_init__(self):
+        # Fail fast at construction — weights are immutable afterwards
+        self.validate()
+
     def validate(self):
         total = self.season + self.last_15 + self.last_5 + self.last_game
         assert abs(total - 1.0) < 0.001, f"Weights must sum to 1.0, got {total}"
@@ -49,7 +61,7 @@ HOME_COURT = {
 # EDGE THRESHOLDS
 # Only flag picks above these minimums
 # ─────────────────────────────────────────────
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EdgeThresholds:
     min_edge_points: float = 1.5       # minimum spread edge to flag
     strong_edge_points: float = 3.0    # "strong" edge
@@ -66,6 +78,9 @@ ODDS_API_BASE = "https://api.the-odds-api.com/v4"
 ODDS_REGIONS = "us"
 ODDS_MARKETS = "spreads,totals,h2h"
 ODDS_BOOKMAKERS = "fanduel,draftkings,betmgm,caesars"  # sharp-ish US books
+ODDS_CACHE_TTL = 60                 # lines move ~every minute; repeat refreshes reuse the pull
+ODDS_CACHE_TTL_LOW_QUOTA = 15 * 60  # stretched once the monthly quota runs low
+ODDS_LOW_QUOTA = 50                 # x-requests-remaining at or below this counts as low
 
 # ─────────────────────────────────────────────
 # NBA API SETTINGS
@@ -78,23 +93,36 @@ NBA_HEADERS = {
     "x-nba-stats-origin": "stats",
     "x-nba-stats-token": "true",
 }
+NBA_FETCH_WORKERS = 4               # concurrent stats.nba.com requests
+NBA_MIN_REQUEST_INTERVAL = 0.5      # seconds between request starts (~2 req/s)
+NBA_CACHE_TTL = 6 * 3600            # team stats only move after game nights
 
 # ─────────────────────────────────────────────
 # BARTTORVIK (NCAAB) SETTINGS
 # ─────────────────────────────────────────────
 BARTTORVIK_BASE = "https://barttorvik.com"
+BARTTORVIK_CACHE_TTL = 3 * 3600
+BARTTORVIK_MIN_REQUEST_INTERVAL = 0.5
 
 # ─────────────────────────────────────────────
 # CONFIDENCE TIERS
 # Maps edge size to human-readable confidence
 # ─────────────────────────────────────────────
+# (high, strong, min) cut points per sport, derived once from the frozen thresholds
+_NBA_TIER_CUTS = (NBA_THRESHOLDS.strong_edge_points * 1.5, NBA_THRESHOLDS.strong_edge_points,
+                  NBA_THRESHOLDS.min_edge_points)
+_NCAAB_TIER_CUTS = (NCAAB_THRESHOLDS.strong_edge_points * 1.5, NCAAB_THRESHOLDS.strong_edge_points,
+                    NCAAB_THRESHOLDS.min_edge_points)
+
+
+@lru_cache(maxsize=2048)
 def get_confidence_tier(edge_points: float, sport: str = "nba") -> str:
-    thresholds = NBA_THRESHOLDS if sport == "nba" else NCAAB_THRESHOLDS
-    if edge_points >= thresholds.strong_edge_points * 1.5:
+    high, strong, minimum = _NBA_TIER_CUTS if sport == "nba" else _NCAAB_TIER_CUTS
+    if edge_points >= high:
         return "🔥 HIGH"
-    elif edge_points >= thresholds.strong_edge_points:
+    elif edge_points >= strong:
         return "✅ STRONG"
-    elif edge_points >= thresholds.min_edge_points:
+    elif edge_points >= minimum:
         return "⚡ MODERATE"
     else:
         return "⚪ LOW"
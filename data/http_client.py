@@ -0,0 +1,187 @@
+"""
+HTTP Helpers
+Shared session setup for the data clients: pooled keep-alive connections,
+retry with backoff on transient errors, an adaptive per-host throttle, and a
+small on-disk response cache that survives process restarts.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    json_loads = orjson.loads      # bytes in, ~2-3x faster than stdlib
+    json_dumps = orjson.dumps      # -> UTF-8 bytes
+except ImportError:                # stdlib fallback; orjson is listed in requirements.txt
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+# Statuses worth retrying — rate limited or upstream hiccup
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def build_session(headers: Optional[Dict[str, str]] = None,
+                  pool_maxsize: int = 8,
+                  retries: int = 3,
+                  backoff_factor: float = 0.5) -> requests.Session:
+    """
+    requests.Session with a pooled HTTPAdapter and urllib3 Retry mounted.
+    Worker threads sharing the session reuse TCP+TLS connections.
+    """
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class Throttle:
+    """
+    Spaces requests at least `interval` seconds apart across threads.
+
+    Each caller reserves the next free slot under the lock, then sleeps
+    outside it — so N workers are staggered instead of serialized.
+
+    The interval is adaptive: it starts at `min_interval`, doubles (up to
+    `max_interval`) whenever the server answers 429, and decays back toward
+    the floor on each clean response. No pressure, no extra idle time.
+    """
+
+    def __init__(self, min_interval: float, max_interval: Optional[float] = None):
+        self.min_interval = min_interval
+        self.max_interval = max_interval if max_interval is not None else max(min_interval * 16, 8.0)
+        self.interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def backoff(self, retry_after: Optional[float] = None):
+        """Server pushed back — widen the spacing and hold off the next slot"""
+        with self._lock:
+            self.interval = min(max(self.interval, 0.25) * 2, self.max_interval)
+            hold = retry_after if retry_after is not None else self.interval
+            self._next_slot = max(self._next_slot, time.monotonic() + hold)
+
+    def relax(self):
+        """Clean response — drift the spacing back toward min_interval"""
+        with self._lock:
+            self.interval = max(self.min_interval, self.interval * 0.75)
+
+
+def _retry_after(resp: requests.Response) -> Optional[float]:
+    try:
+        return float(resp.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
+def throttled_get(session: requests.Session, throttle: Throttle, url: str, **kwargs) -> requests.Response:
+    """
+    session.get paced by `throttle`, feeding 429s back into it.
+
+    urllib3's Retry already sleeps out Retry-After between attempts; this
+    makes the pressure stick for the *next* requests too. A 429 that was
+    retried away still shows up in the response's retry history.
+    """
+    throttle.wait()
+    try:
+        resp = session.get(url, **kwargs)
+    except requests.exceptions.RetryError:
+        throttle.backoff()   # retries exhausted on 429/5xx
+        raise
+
+    retries = getattr(resp.raw, "retries", None)
+    history = getattr(retries, "history", ())
+    if resp.status_code == 429:
+        throttle.backoff(_retry_after(resp))
+    elif any(h.status == 429 for h in history):
+        throttle.backoff()
+    else:
+        throttle.relax()
+    return resp
+
+
+class DiskCache:
+    """
+    JSON response cache on disk — one file per (url, params).
+
+    Freshness is the file's mtime; pass max_age=None to accept any age
+    (used as a stale fallback when the network request fails).
+    Never put secrets (API keys) in the params used for the key.
+
+    Keys that embed dates (e.g. last-N-days windows) are never read again
+    once the day rolls over, so files older than `max_file_age` are swept
+    on construction — that also bounds how stale a fallback can get.
+    """
+
+    def __init__(self, directory: str, max_file_age: Optional[float] = None):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        if max_file_age is not None:
+            self._sweep(max_file_age)
+
+    def _sweep(self, max_file_age: float):
+        cutoff = time.time() - max_file_age
+        try:
+            entries = list(os.scandir(self.directory))
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except OSError:
+                pass  # raced with another process or already gone
+
+    def _path(self, url: str, params: Dict[str, Any]) -> str:
+        key = url + "?" + urlencode(sorted(params.items()))
+        return os.path.join(self.directory, hashlib.sha1(key.encode()).hexdigest() + ".json")
+
+    def get(self, url: str, params: Dict[str, Any], max_age: Optional[float]) -> Optional[Any]:
+        path = self._path(url, params)
+        try:
+            if max_age is not None and time.time() - os.path.getmtime(path) > max_age:
+                return None
+            with open(path, "rb") as f:
+                return json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def set(self, url: str, params: Dict[str, Any], data: Any):
+        path = self._path(url, params)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, path)  # atomic — readers never see a partial file
+        except OSError as e:
+            print(f"[HTTP CACHE] Write failed: {e}")
@@ -5,7 +5,7 @@ Uses a simple tiered impact model based on player role.
 """
 import requests
 from typing import Dict, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -41,21 +41,31 @@ ROLE_IMPACT = {
     PlayerRole.BENCH: 0.3,
 }
 
+# Expected spread impact for every (status, role) pair — 20 entries, built once
+IMPACT_LUT = {
+    (status, role): round(-1 * miss_prob * base, 2)
+    for status, miss_prob in STATUS_MISS_PROB.items()
+    for role, base in ROLE_IMPACT.items()
+}
+
+# String value -> enum member, for bulk loads from dicts/JSON
+_STATUS_BY_NAME = {s.value: s for s in InjuryStatus}
+_ROLE_BY_NAME = {r.value: r for r in PlayerRole}
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InjuryEntry:
     player_name: str
     team: str
     status: InjuryStatus
     role: PlayerRole
     reason: str = ""
+    # Expected spread impact in points (negative = hurts team).
+    # Computed once at construction — entries are immutable.
+    expected_impact: float = field(init=False)
 
-    @property
-    def expected_impact(self) -> float:
-        """Expected spread impact in points (negative = hurts team)"""
-        miss_prob = STATUS_MISS_PROB[self.status]
-        base = ROLE_IMPACT[self.role]
-        return round(-1 * miss_prob * base, 2)
+    def __post_init__(self):
+        object.__setattr__(self, "expected_impact", IMPACT_LUT[self.status, self.role])
 
 
 class InjuryTracker:
@@ -82,7 +92,13 @@ class InjuryTracker:
     """
 
     def __init__(self):
-        self.injuries: Dict[str, List[InjuryEntry]] = {}  # keyed by team
+        # team -> player -> entry; insertion order is kept (re-adding moves a player to the end)
+        self.injuries: Dict[str, Dict[str, InjuryEntry]] = {}
+        self._team_total: Dict[str, float] = {}           # cached sum of expected_impact per team
+
+    def _refresh_total(self, team: str):
+        """Recompute the cached impact total for one team after it changes"""
+        self._team_total[team] = sum(entry.expected_impact for entry in self.injuries.get(team, {}).values())
 
     def add_injury(self, player: str, team: str, status: InjuryStatus,
                    role: PlayerRole, reason: str = ""):
@@ -94,38 +110,36 @@ class InjuryTracker:
             role=role,
             reason=reason,
         )
-        if team.upper() not in self.injuries:
-            self.injuries[team.upper()] = []
+        team_injuries = self.injuries.setdefault(team.upper(), {})
 
-        # Update existing or add new
-        existing = [i for i in self.injuries[team.upper()] if i.player_name == player]
-        if existing:
-            self.injuries[team.upper()].remove(existing[0])
-        self.injuries[team.upper()].append(entry)
+        # Update existing or add new (O(1) — no scan over the team's list)
+        team_injuries.pop(player, None)
+        team_injuries[player] = entry
+        self._refresh_total(team.upper())
 
     def remove_injury(self, player: str, team: str):
         """Remove a player from injury list (they're healthy)"""
         team = team.upper()
         if team in self.injuries:
-            self.injuries[team] = [i for i in self.injuries[team] if i.player_name != player]
+            self.injuries[team].pop(player, None)
+            self._refresh_total(team)
 
     def clear_team(self, team: str):
         """Clear all injuries for a team"""
-        self.injuries[team.upper()] = []
+        self.injuries[team.upper()] = {}
+        self._team_total[team.upper()] = 0.0
 
     def clear_all(self):
         """Reset all injuries"""
         self.injuries = {}
+        self._team_total = {}
 
     def get_team_impact(self, team: str) -> float:
         """
         Total expected spread impact for a team's injuries.
         Returns negative number (injuries hurt team).
         """
-        team = team.upper()
-        if team not in self.injuries:
-            return 0.0
-        return sum(entry.expected_impact for entry in self.injuries[team])
+        return self._team_total.get(team.upper(), 0.0)
 
     def get_matchup_impact(self, team_a: str, team_b: str) -> float:
         """
@@ -140,7 +154,7 @@ class InjuryTracker:
 
     def get_team_injuries(self, team: str) -> List[InjuryEntry]:
         """Get all injury entries for a team"""
-        return self.injuries.get(team.upper(), [])
+        return list(self.injuries.get(team.upper(), {}).values())
 
     def get_summary(self, team: str) -> str:
         """Human-readable injury summary for a team"""
@@ -172,18 +186,21 @@ class InjuryTracker:
                 ],
             })
         """
-        status_map = {s.value: s for s in InjuryStatus}
-        role_map = {r.value: r for r in PlayerRole}
-
+        # Same upsert semantics as add_injury, but the team total is summed once per team
         for team, players in injury_data.items():
+            team = team.upper()
+            team_injuries = self.injuries.setdefault(team, {})
             for p in players:
-                self.add_injury(
-                    player=p["player"],
+                player = p["player"]
+                team_injuries.pop(player, None)
+                team_injuries[player] = InjuryEntry(
+                    player_name=player,
                     team=team,
-                    status=status_map.get(p.get("status", "out"), InjuryStatus.OUT),
-                    role=role_map.get(p.get("role", "rotation"), PlayerRole.ROTATION),
+                    status=_STATUS_BY_NAME.get(p.get("status", "out"), InjuryStatus.OUT),
+                    role=_ROLE_BY_NAME.get(p.get("role", "rotation"), PlayerRole.ROTATION),
                     reason=p.get("reason", ""),
                 )
+            self._refresh_total(team)
 
 
 if __name__ == "__main__":
@@ -3,19 +3,93 @@ NBA Stats Client
 Pulls team-level efficiency data from stats.nba.com
 Handles Season / Last 15 / Last 5 / Last 1 game windows
 """
-import requests
-import time
-from typing import Dict, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+import pandas as pd
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from types import MappingProxyType
 import json
 
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-from config import NBA_STATS_BASE, NBA_HEADERS
+from config import (NBA_STATS_BASE, NBA_HEADERS, NBA_FETCH_WORKERS, NBA_MIN_REQUEST_INTERVAL,
+                    NBA_CACHE_TTL, HTTP_CACHE_DIR, HTTP_CACHE_MAX_AGE)
+from data.http_client import build_session, throttled_get, Throttle, DiskCache, json_loads
 
+# leaguedashteamstats query params that never change; _fetch_team_stats overlays the rest
+_NBA_PARAMS_BASE = MappingProxyType({
+    "Conference": "",
+    "DateFrom": "",
+    "DateTo": "",
+    "Division": "",
+    "GameScope": "",
+    "GameSegment": "",
+    "Height": "",
+    "LeagueID": "00",
+    "Location": "",
+    "Month": 0,
+    "OpponentTeamID": 0,
+    "Outcome": "",
+    "PORound": 0,
+    "PaceAdjust": "N",
+    "Period": 0,
+    "PlayerExperience": "",
+    "PlayerPosition": "",
+    "PlusMinus": "N",
+    "Rank": "N",
+    "SeasonSegment": "",
+    "SeasonType": "Regular Season",
+    "ShotClockRange": "",
+    "StarterBench": "",
+    "TeamID": 0,
+    "TwoWay": 0,
+    "VsConference": "",
+    "VsDivision": "",
+})
 
-@dataclass
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# (window tag, LastNGames) — the four windows pulled for every team
+NBA_WINDOWS = (("season", 0), ("last_15", 15), ("last_5", 5), ("last_1", 1))
+
+# Merged-frame column feeding each TeamMetrics field, in field order, with
+# the value used when the API omits the column. "B_" = from the Base table.
+_METRIC_COLUMNS = (
+    ("TEAM_ID", 0),
+    ("TEAM_NAME", ""),
+    ("TEAM_ABBREVIATION", ""),
+    ("GP", 0),
+    ("W", 0),
+    ("L", 0),
+    ("OFF_RATING", 0.0),
+    ("DEF_RATING", 0.0),
+    ("NET_RATING", 0.0),
+    ("PACE", 0.0),
+    ("TS_PCT", 0.0),
+    ("REB_PCT", 0.0),
+    ("TM_TOV_PCT", 0.0),
+    ("B_EFG_PCT", 0.0),
+    ("B_FG3_PCT", 0.0),
+    ("B_FG3A_RANK", 0.0),
+    ("B_FT_PCT", 0.0),
+    ("OPP_EFG_PCT", 0.0),
+)
+_BASE_COLUMNS = ["EFG_PCT", "FG3_PCT", "FG3A_RANK", "FT_PCT"]
+
+# Column names / dtypes of the per-window metrics frame (TeamMetrics field order)
+_METRIC_FIELDS = [
+    "team_id", "team_name", "team_abbr", "games_played", "wins", "losses",
+    "off_rating", "def_rating", "net_rating", "pace", "ts_pct", "reb_pct",
+    "tov_pct", "efg_pct", "fg3_pct", "fg3a_rate", "ft_rate", "opp_efg_pct",
+]
+_METRIC_DTYPES = {f: "float64" for f in _METRIC_FIELDS[6:]}
+
+
+@dataclass(slots=True)
 class TeamMetrics:
     """Core efficiency metrics for a single time window"""
     team_id: int
@@ -42,8 +116,13 @@ class TeamMetrics:
     def record(self) -> str:
         return f"{self.wins}-{self.losses}"
 
+    @classmethod
+    def from_row(cls, row, window: str) -> "TeamMetrics":
+        """View over one row of NBAStatsClient.metrics[window] (from itertuples)"""
+        return cls(*row, window=window)
 
-@dataclass
+
+@dataclass(slots=True)
 class TeamProfile:
     """All time-window metrics for one team"""
     team_id: int
@@ -69,103 +148,88 @@ class NBAStatsClient:
 
     def __init__(self, season: str = "2025-26"):
         self.season = season
-        self.session = requests.Session()
-        self.session.headers.update(NBA_HEADERS)
-        self._cache: Dict[str, any] = {}
+        self.session = build_session(NBA_HEADERS)
+        self._throttle = Throttle(NBA_MIN_REQUEST_INTERVAL)
+        self._disk = DiskCache(HTTP_CACHE_DIR, HTTP_CACHE_MAX_AGE)   # persists across runs
+        self._cache: Dict[str, any] = {}         # in-process
+        # Column-oriented metrics per window, indexed by team abbreviation.
+        # TeamMetrics objects are views built from these rows.
+        self.metrics: Dict[str, pd.DataFrame] = {}
 
-    def _fetch_team_stats(self, last_n_games: int = 0, measure_type: str = "Advanced") -> List[dict]:
+    def _fetch_team_stats(self, last_n_games: int = 0, measure_type: str = "Advanced") -> pd.DataFrame:
         """
         Pull team stats from leaguedashteamstats endpoint.
-        last_n_games=0 means full season.
+        last_n_games=0 means full season. Empty frame on failure.
         """
         cache_key = f"team_stats_{measure_type}_{last_n_games}"
         if cache_key in self._cache:
             return self._cache[cache_key]
 
         params = {
-            "Conference": "",
-            "DateFrom": "",
-            "DateTo": "",
-            "Division": "",
-            "GameScope": "",
-            "GameSegment": "",
-            "Height": "",
+            **_NBA_PARAMS_BASE,
             "LastNGames": last_n_games,
-            "LeagueID": "00",
-            "Location": "",
             "MeasureType": measure_type,
-            "Month": 0,
-            "OpponentTeamID": 0,
-            "Outcome": "",
-            "PORound": 0,
-            "PaceAdjust": "N",
             "PerMode": "Per100Possessions" if measure_type == "Base" else "PerGame",
-            "Period": 0,
-            "PlayerExperience": "",
-            "PlayerPosition": "",
-            "PlusMinus": "N",
-            "Rank": "N",
             "Season": self.season,
-            "SeasonSegment": "",
-            "SeasonType": "Regular Season",
-            "ShotClockRange": "",
-            "StarterBench": "",
-            "TeamID": 0,
-            "TwoWay": 0,
-            "VsConference": "",
-            "VsDivision": "",
         }
 
         url = f"{NBA_STATS_BASE}/leaguedashteamstats"
 
-        try:
-            resp = self.session.get(url, params=params, timeout=30)
-            resp.raise_for_status()
-            data = resp.json()
-        except Exception as e:
-            print(f"[NBA API] Error fetching {measure_type} (last {last_n_games}): {e}")
-            return []
+        data = self._disk.get(url, params, max_age=NBA_CACHE_TTL)
+        if data is None:
+            try:
+                # Paced by the shared throttle, which widens on 429s
+                resp = throttled_get(self.session, self._throttle, url, params=params, timeout=30)
+                resp.raise_for_status()
+                data = json_loads(resp.content)
+                self._disk.set(url, params, data)
+            except Exception as e:
+                data = self._disk.get(url, params, max_age=None)
+                if data is None:
+                    print(f"[NBA API] Error fetching {measure_type} (last {last_n_games}): {e}")
+                    return pd.DataFrame()
+                print(f"[NBA API] Error fetching {measure_type} (last {last_n_games}), using stale cache: {e}")
 
         headers = data["resultSets"][0]["headers"]
         rows = data["resultSets"][0]["rowSet"]
-        result = [dict(zip(headers, row)) for row in rows]
+        result = pd.DataFrame(rows, columns=headers)
         self._cache[cache_key] = result
-
-        time.sleep(0.6)  # rate limit courtesy
         return result
 
-    def _parse_team_metrics(self, adv_row: dict, base_row: dict, window: str) -> TeamMetrics:
-        """Convert raw API rows into a TeamMetrics object"""
-        return TeamMetrics(
-            team_id=adv_row.get("TEAM_ID", 0),
-            team_name=adv_row.get("TEAM_NAME", ""),
-            team_abbr=adv_row.get("TEAM_ABBREVIATION", ""),
-            games_played=adv_row.get("GP", 0),
-            wins=adv_row.get("W", 0),
-            losses=adv_row.get("L", 0),
-            off_rating=adv_row.get("OFF_RATING", 0.0),
-            def_rating=adv_row.get("DEF_RATING", 0.0),
-            net_rating=adv_row.get("NET_RATING", 0.0),
-            pace=adv_row.get("PACE", 0.0),
-            ts_pct=adv_row.get("TS_PCT", 0.0),
-            reb_pct=adv_row.get("REB_PCT", 0.0),
-            tov_pct=adv_row.get("TM_TOV_PCT", 0.0),
-            efg_pct=base_row.get("EFG_PCT", 0.0) if base_row else 0.0,
-            fg3_pct=base_row.get("FG3_PCT", 0.0) if base_row else 0.0,
-            fg3a_rate=base_row.get("FG3A_RANK", 0.0) if base_row else 0.0,
-            ft_rate=base_row.get("FT_PCT", 0.0) if base_row else 0.0,
-            opp_efg_pct=adv_row.get("OPP_EFG_PCT", 0.0),
-            window=window,
-        )
+    def _build_profiles(self, adv: pd.DataFrame, base: pd.DataFrame, window: str) -> Dict[str, TeamMetrics]:
+        """
+        Build TeamMetrics dict keyed by team abbreviation.
+        One left-join of Advanced + Base on TEAM_ABBREVIATION, stored as
+        self.metrics[window], then a single itertuples pass — no per-team
+        dict lookups.
+        """
+        if adv.empty:
+            return {}
+
+        base = (base.reindex(columns=["TEAM_ABBREVIATION"] + _BASE_COLUMNS)
+                    .drop_duplicates("TEAM_ABBREVIATION", keep="last")
+                    .rename(columns={c: f"B_{c}" for c in _BASE_COLUMNS}))
+        df = adv.merge(base, on="TEAM_ABBREVIATION", how="left")
+        # Teams missing from the Base table get 0.0 for the base-derived fields
+        df[base.columns[1:]] = df[base.columns[1:]].fillna(0.0)
+
+        missing = {col: default for col, default in _METRIC_COLUMNS if col not in df}
+        if missing:
+            df = df.assign(**missing)
+
+        frame = (df[[col for col, _ in _METRIC_COLUMNS]]
+                 .set_axis(_METRIC_FIELDS, axis=1)
+                 .astype(_METRIC_DTYPES))
+        # Interned so every window / lookup shares one object per team string
+        for col in ("team_name", "team_abbr"):
+            frame[col] = frame[col].map(_intern)
+        frame.index = frame["team_abbr"]
+        self.metrics[window] = frame
 
-    def _build_profiles(self, adv_rows: List[dict], base_rows: List[dict], window: str) -> Dict[str, TeamMetrics]:
-        """Build TeamMetrics dict keyed by team abbreviation"""
-        base_lookup = {r.get("TEAM_ABBREVIATION", ""): r for r in base_rows}
         result = {}
-        for row in adv_rows:
-            abbr = row.get("TEAM_ABBREVIATION", "")
-            base_row = base_lookup.get(abbr, {})
-            result[abbr] = self._parse_team_metrics(row, base_row, window)
+        for row in frame.itertuples(index=False, name=None):
+            metrics = TeamMetrics.from_row(row, window)
+            result[metrics.team_abbr] = metrics
         return result
 
     def get_all_team_profiles(self) -> Dict[str, TeamProfile]:
@@ -175,26 +239,21 @@ class NBAStatsClient:
         Returns:
             Dict[str, TeamProfile] keyed by team abbreviation (e.g. "SAS", "LAL")
         """
-        print("[NBA] Pulling season stats...")
-        season_adv = self._fetch_team_stats(last_n_games=0, measure_type="Advanced")
-        season_base = self._fetch_team_stats(last_n_games=0, measure_type="Base")
-
-        print("[NBA] Pulling last 15 games...")
-        l15_adv = self._fetch_team_stats(last_n_games=15, measure_type="Advanced")
-        l15_base = self._fetch_team_stats(last_n_games=15, measure_type="Base")
-
-        print("[NBA] Pulling last 5 games...")
-        l5_adv = self._fetch_team_stats(last_n_games=5, measure_type="Advanced")
-        l5_base = self._fetch_team_stats(last_n_games=5, measure_type="Base")
-
-        print("[NBA] Pulling last game...")
-        l1_adv = self._fetch_team_stats(last_n_games=1, measure_type="Advanced")
-        l1_base = self._fetch_team_stats(last_n_games=1, measure_type="Base")
-
-        season_map = self._build_profiles(season_adv, season_base, "season")
-        l15_map = self._build_profiles(l15_adv, l15_base, "last_15")
-        l5_map = self._build_profiles(l5_adv, l5_base, "last_5")
-        l1_map = self._build_profiles(l1_adv, l1_base, "last_1")
+        # 8 independent requests (Advanced/Base x 4 windows) — run them on a
+        # small pool; the throttle keeps the request rate polite.
+        print("[NBA] Pulling season / last 15 / last 5 / last game stats...")
+        with ThreadPoolExecutor(max_workers=NBA_FETCH_WORKERS) as pool:
+            futures = {
+                (window, measure): pool.submit(self._fetch_team_stats, last_n_games=n, measure_type=measure)
+                for window, n in NBA_WINDOWS
+                for measure in ("Advanced", "Base")
+            }
+            rows = {key: f.result() for key, f in futures.items()}
+
+        season_map, l15_map, l5_map, l1_map = (
+            self._build_profiles(rows[(window, "Advanced")], rows[(window, "Base")], window)
+            for window, _ in NBA_WINDOWS
+        )
 
         profiles: Dict[str, TeamProfile] = {}
         for abbr in season_map:
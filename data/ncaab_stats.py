@@ -3,20 +3,58 @@ NCAAB Stats Client
 Pulls team-level efficiency data from Barttorvik (barttorvik.com)
 Also supports manual CSV import from KenPom exports
 """
-import requests
 import csv
 import io
-import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, List
 from dataclasses import dataclass
 from datetime import datetime
 
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-from config import BARTTORVIK_BASE
+from config import (BARTTORVIK_BASE, BARTTORVIK_CACHE_TTL, BARTTORVIK_MIN_REQUEST_INTERVAL,
+                    HTTP_CACHE_DIR, HTTP_CACHE_MAX_AGE)
+from data.http_client import build_session, throttled_get, Throttle, DiskCache, json_loads
 
 
-@dataclass
+# KenPom / Barttorvik CSV export columns: (accepted header spellings, default if absent).
+# Order matches the unpacking in NCAABStatsClient.load_from_csv.
+_CSV_COLUMNS = (
+    (("Team", "team"), ""),
+    (("Conf", "conf"), ""),
+    (("W",), 0),
+    (("L",), 0),
+    (("AdjOE", "AdjO"), 0),
+    (("AdjDE", "AdjD"), 0),
+    (("AdjTempo", "Tempo"), 0),
+    (("eFG%", "EFG"), 0),
+    (("OppeFG%", "OEFG"), 0),
+    (("TO%", "TOV"), 0),
+    (("OppTO%", "OTOV"), 0),
+    (("OR%", "ORB"), 0),
+    (("FTRate", "FTR"), 0),
+    (("3P%", "FG3"), 0),
+    (("3PA%", "FG3A"), 0),
+)
+
+# Barttorvik 'pointed' row indices actually read by _parse_barttorvik_row.
+# Rows are projected to these columns as soon as they arrive, so the ~40-wide
+# raw rows aren't kept in memory. Ascending order keeps length semantics: a
+# short raw row projects to a short compact row.
+_BART_KEEP_IDX = (0, 1, 3, 5, 7, 9, 11, 12, 13, 14, 15, 17, 18, 19)
+
+
+def _project_bart_rows(data) -> List[list]:
+    """Trim raw Barttorvik rows down to the _BART_KEEP_IDX columns"""
+    if not isinstance(data, list):
+        return []
+    return [
+        [row[i] for i in _BART_KEEP_IDX if i < len(row)]
+        for row in data if isinstance(row, (list, tuple))
+    ]
+
+
+@dataclass(slots=True)
 class NCAABTeamMetrics:
     """Core efficiency metrics for a single NCAAB time window"""
     team_name: str
@@ -43,7 +81,7 @@ class NCAABTeamMetrics:
         return f"{self.wins}-{self.losses}"
 
 
-@dataclass
+@dataclass(slots=True)
 class NCAABTeamProfile:
     """All time-window metrics for one NCAAB team"""
     team_name: str
@@ -69,13 +107,14 @@ class NCAABStatsClient:
 
     def __init__(self, season: int = 2026):
         self.season = season
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.session = build_session({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         })
-        self._cache: Dict[str, any] = {}
+        self._throttle = Throttle(BARTTORVIK_MIN_REQUEST_INTERVAL)
+        self._disk = DiskCache(HTTP_CACHE_DIR, HTTP_CACHE_MAX_AGE)   # persists across runs
+        self._cache: Dict[str, any] = {}         # in-process
 
-    def _fetch_barttorvik_data(self, start_date: str = "", end_date: str = "") -> List[dict]:
+    def _fetch_barttorvik_data(self, start_date: str = "", end_date: str = "") -> List[list]:
         """
         Fetch team data from Barttorvik's getteamdata endpoint.
         Dates in YYYYMMDD format. Empty = full season.
@@ -95,43 +134,55 @@ class NCAABStatsClient:
         if end_date:
             params["end"] = end_date
 
+        # Disk keeps the raw payload; the in-process cache keeps projected rows
+        data = self._disk.get(url, params, max_age=BARTTORVIK_CACHE_TTL)
+        if data is not None:
+            rows = self._cache[cache_key] = _project_bart_rows(data)
+            return rows
+
         try:
-            resp = self.session.get(url, params=params, timeout=30)
+            resp = throttled_get(self.session, self._throttle, url, params=params, timeout=30)
             resp.raise_for_status()
-            data = resp.json()
+            data = json_loads(resp.content)
         except Exception as e:
-            print(f"[NCAAB/Barttorvik] Error: {e}")
-            return []
+            data = self._disk.get(url, params, max_age=None)
+            if data is None:
+                print(f"[NCAAB/Barttorvik] Error: {e}")
+                return []
+            print(f"[NCAAB/Barttorvik] Error, using stale cache: {e}")
+            rows = self._cache[cache_key] = _project_bart_rows(data)
+            return rows
 
-        self._cache[cache_key] = data
-        time.sleep(0.5)
-        return data
+        self._disk.set(url, params, data)
+        rows = self._cache[cache_key] = _project_bart_rows(data)
+        return rows
 
     def _parse_barttorvik_row(self, row: list, window: str) -> NCAABTeamMetrics:
         """
-        Parse a Barttorvik JSON row into NCAABTeamMetrics.
-        Row format varies — this handles the common 'pointed' type layout.
-        Indices may shift with site updates; adjust as needed.
+        Parse a projected Barttorvik row (see _BART_KEEP_IDX) into NCAABTeamMetrics.
+        Positions below are compact; the comment on each is the raw 'pointed' index.
+        Raw indices may shift with site updates; adjust _BART_KEEP_IDX as needed.
         """
+        n = len(row)
         try:
             return NCAABTeamMetrics(
-                team_name=str(row[0]) if len(row) > 0 else "",
-                conf=str(row[1]) if len(row) > 1 else "",
-                games_played=int(row[3]) if len(row) > 3 else 0,
-                wins=int(row[3]) if len(row) > 3 else 0,  # approximate
+                team_name=sys.intern(str(row[0])) if n > 0 else "",  # raw 0
+                conf=sys.intern(str(row[1])) if n > 1 else "",       # raw 1
+                games_played=int(row[2]) if n > 2 else 0,            # raw 3
+                wins=int(row[2]) if n > 2 else 0,  # approximate
                 losses=0,
-                adj_off=float(row[5]) if len(row) > 5 else 0.0,
-                adj_def=float(row[7]) if len(row) > 7 else 0.0,
-                adj_net=float(row[5]) - float(row[7]) if len(row) > 7 else 0.0,
-                tempo=float(row[9]) if len(row) > 9 else 0.0,
-                efg_pct=float(row[11]) if len(row) > 11 else 0.0,
-                opp_efg_pct=float(row[12]) if len(row) > 12 else 0.0,
-                tov_pct=float(row[13]) if len(row) > 13 else 0.0,
-                opp_tov_pct=float(row[14]) if len(row) > 14 else 0.0,
-                orb_pct=float(row[15]) if len(row) > 15 else 0.0,
-                ft_rate=float(row[17]) if len(row) > 17 else 0.0,
-                fg3_pct=float(row[18]) if len(row) > 18 else 0.0,
-                fg3a_rate=float(row[19]) if len(row) > 19 else 0.0,
+                adj_off=float(row[3]) if n > 3 else 0.0,             # raw 5
+                adj_def=float(row[4]) if n > 4 else 0.0,             # raw 7
+                adj_net=float(row[3]) - float(row[4]) if n > 4 else 0.0,
+                tempo=float(row[5]) if n > 5 else 0.0,               # raw 9
+                efg_pct=float(row[6]) if n > 6 else 0.0,             # raw 11
+                opp_efg_pct=float(row[7]) if n > 7 else 0.0,         # raw 12
+                tov_pct=float(row[8]) if n > 8 else 0.0,             # raw 13
+                opp_tov_pct=float(row[9]) if n > 9 else 0.0,         # raw 14
+                orb_pct=float(row[10]) if n > 10 else 0.0,           # raw 15
+                ft_rate=float(row[11]) if n > 11 else 0.0,           # raw 17
+                fg3_pct=float(row[12]) if n > 12 else 0.0,           # raw 18
+                fg3a_rate=float(row[13]) if n > 13 else 0.0,         # raw 19
                 window=window,
             )
         except (ValueError, IndexError) as e:
@@ -149,31 +200,49 @@ class NCAABStatsClient:
         metrics = {}
         try:
             with open(filepath, "r") as f:
-                reader = csv.DictReader(f)
+                reader = csv.reader(f)
+                header = next(reader, [])
+                # Resolve header aliases to column positions once per file
+                idx = {h: i for i, h in enumerate(header)}
+                cols = [(next((idx[h] for h in names if h in idx), None), default)
+                        for names, default in _CSV_COLUMNS]
+                width = len(header)
+
                 for row in reader:
-                    name = row.get("Team", row.get("team", "")).strip()
+                    if not row:
+                        continue
+                    if len(row) < width:
+                        row += [None] * (width - len(row))
+                    (team, conf, wins, losses, adj_off, adj_def, tempo, efg, opp_efg,
+                     tov, opp_tov, orb, ft_rate, fg3, fg3a) = [
+                        row[i] if i is not None else default for i, default in cols
+                    ]
+
+                    name = sys.intern(team.strip())
                     if not name:
                         continue
-                    adj_off = float(row.get("AdjOE", row.get("AdjO", 0)))
-                    adj_def = float(row.get("AdjDE", row.get("AdjD", 0)))
+                    if isinstance(conf, str):
+                        conf = sys.intern(conf)
+                    adj_off = float(adj_off)
+                    adj_def = float(adj_def)
                     metrics[name] = NCAABTeamMetrics(
                         team_name=name,
-                        conf=row.get("Conf", row.get("conf", "")),
-                        games_played=int(row.get("W", 0)) + int(row.get("L", 0)),
-                        wins=int(row.get("W", 0)),
-                        losses=int(row.get("L", 0)),
+                        conf=conf,
+                        games_played=int(wins) + int(losses),
+                        wins=int(wins),
+                        losses=int(losses),
                         adj_off=adj_off,
                         adj_def=adj_def,
                         adj_net=adj_off - adj_def,
-                        tempo=float(row.get("AdjTempo", row.get("Tempo", 0))),
-                        efg_pct=float(row.get("eFG%", row.get("EFG", 0))),
-                        opp_efg_pct=float(row.get("OppeFG%", row.get("OEFG", 0))),
-                        tov_pct=float(row.get("TO%", row.get("TOV", 0))),
-                        opp_tov_pct=float(row.get("OppTO%", row.get("OTOV", 0))),
-                        orb_pct=float(row.get("OR%", row.get("ORB", 0))),
-                        ft_rate=float(row.get("FTRate", row.get("FTR", 0))),
-                        fg3_pct=float(row.get("3P%", row.get("FG3", 0))),
-                        fg3a_rate=float(row.get("3PA%", row.get("FG3A", 0))),
+                        tempo=float(tempo),
+                        efg_pct=float(efg),
+                        opp_efg_pct=float(opp_efg),
+                        tov_pct=float(tov),
+                        opp_tov_pct=float(opp_tov),
+                        orb_pct=float(orb),
+                        ft_rate=float(ft_rate),
+                        fg3_pct=float(fg3),
+                        fg3a_rate=float(fg3a),
                         window=window,
                     )
         except Exception as e:
@@ -199,10 +268,16 @@ class NCAABStatsClient:
 
         profiles: Dict[str, NCAABTeamProfile] = {}
 
-        for window, (start, end) in dates.items():
-            print(f"[NCAAB] Pulling {window} stats...")
-            rows = self._fetch_barttorvik_data(start_date=start, end_date=end)
+        # The windows are independent date-range queries — fetch them together
+        print(f"[NCAAB] Pulling {' / '.join(dates)} stats...")
+        with ThreadPoolExecutor(max_workers=len(dates)) as pool:
+            futures = {
+                window: pool.submit(self._fetch_barttorvik_data, start_date=start, end_date=end)
+                for window, (start, end) in dates.items()
+            }
+            rows_by_window = {window: f.result() for window, f in futures.items()}
 
+        for window, rows in rows_by_window.items():
             for row in rows:
                 metrics = self._parse_barttorvik_row(row, window)
                 if metrics is None:
@@ -4,18 +4,33 @@ Pulls live spreads, totals, and moneylines from The Odds API
 https://the-odds-api.com
 Free tier: 500 requests/month
 """
-import requests
 import time
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
+import numpy as np
+
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-from config import ODDS_API_KEY, ODDS_API_BASE, ODDS_REGIONS, ODDS_MARKETS, ODDS_BOOKMAKERS
+from config import (ODDS_API_KEY, ODDS_API_BASE, ODDS_REGIONS, ODDS_MARKETS, ODDS_BOOKMAKERS,
+                    ODDS_CACHE_TTL, ODDS_CACHE_TTL_LOW_QUOTA, ODDS_LOW_QUOTA, HTTP_CACHE_DIR,
+                    HTTP_CACHE_MAX_AGE)
+from data.http_client import build_session, DiskCache, json_loads
+
+
+# American odds -> implied probability for every whole-number price in ±2000,
+# the realistic range; anything outside falls back to the formula
+_IMPLIED_PROB = {
+    m: (100 / (m + 100) if m > 0 else abs(m) / (abs(m) + 100))
+    for m in range(-2000, 2001)
+}
 
+# Books trusted for the sharpest line, best first
+SHARP_BOOK_ORDER = ("pinnacle", "fanduel", "draftkings")
 
-@dataclass
+
+@dataclass(slots=True)
 class BookLine:
     """A single bookmaker's line for a game"""
     bookmaker: str
@@ -31,7 +46,7 @@ class BookLine:
     updated: str
 
 
-@dataclass
+@dataclass(slots=True)
 class GameOdds:
     """All odds data for a single game"""
     game_id: str
@@ -40,30 +55,61 @@ class GameOdds:
     home_team: str
     away_team: str
     books: List[BookLine] = field(default_factory=list)
+    # Consensus values filled for the whole slate by _fill_consensus, or memoized on
+    # first access otherwise (books are fixed once a game is parsed). None = not yet computed.
+    _consensus_spread_home: Optional[float] = field(init=False, default=None, repr=False, compare=False)
+    _consensus_total: Optional[float] = field(init=False, default=None, repr=False, compare=False)
+    _home_implied_prob: Optional[float] = field(init=False, default=None, repr=False, compare=False)
+    _book_by_key: Optional[Dict[str, BookLine]] = field(init=False, default=None, repr=False, compare=False)
 
     @property
     def consensus_spread_home(self) -> float:
         """Average home spread across all books"""
-        spreads = [b.spread_home for b in self.books if b.spread_home != 0]
-        return sum(spreads) / len(spreads) if spreads else 0.0
+        if self._consensus_spread_home is not None:
+            return self._consensus_spread_home
+        total = count = 0.0
+        for b in self.books:
+            v = b.spread_home
+            if v != 0:
+                total += v
+                count += 1
+        self._consensus_spread_home = total / count if count else 0.0
+        return self._consensus_spread_home
 
     @property
     def consensus_total(self) -> float:
         """Average total across all books"""
-        totals = [b.total for b in self.books if b.total != 0]
-        return sum(totals) / len(totals) if totals else 0.0
+        if self._consensus_total is not None:
+            return self._consensus_total
+        total = count = 0.0
+        for b in self.books:
+            v = b.total
+            if v != 0:
+                total += v
+                count += 1
+        self._consensus_total = total / count if count else 0.0
+        return self._consensus_total
 
     @property
     def sharpest_spread_home(self) -> float:
         """Use Pinnacle if available, else FanDuel, else consensus"""
-        for preferred in ["pinnacle", "fanduel", "draftkings"]:
+        by_key = self._book_by_key
+        if by_key is None:
+            # bookmaker -> first line from that book, built on first use
+            by_key = self._book_by_key = {}
             for b in self.books:
-                if b.bookmaker == preferred:
-                    return b.spread_home
+                by_key.setdefault(b.bookmaker, b)
+        for preferred in SHARP_BOOK_ORDER:
+            b = by_key.get(preferred)
+            if b is not None:
+                return b.spread_home
         return self.consensus_spread_home
 
     def implied_probability(self, american_odds: int) -> float:
         """Convert American odds to implied probability"""
+        prob = _IMPLIED_PROB.get(american_odds)
+        if prob is not None:
+            return prob
         if american_odds > 0:
             return 100 / (american_odds + 100)
         else:
@@ -72,11 +118,63 @@ class GameOdds:
     @property
     def home_implied_prob(self) -> float:
         """Implied win probability for home team from consensus ML"""
-        mls = [b.ml_home for b in self.books if b.ml_home != 0]
-        if not mls:
-            return 0.5
-        avg_ml = sum(mls) / len(mls)
-        return self.implied_probability(int(avg_ml))
+        if self._home_implied_prob is not None:
+            return self._home_implied_prob
+        total = count = 0.0
+        for b in self.books:
+            v = b.ml_home
+            if v != 0:
+                total += v
+                count += 1
+        if not count:
+            self._home_implied_prob = 0.5
+        else:
+            self._home_implied_prob = self.implied_probability(int(total / count))
+        return self._home_implied_prob
+
+
+def _nonzero_means(values: np.ndarray, game_idx: np.ndarray, n_games: int):
+    """Per-game mean of the nonzero entries (0.0 where a game has none) + per-game counts"""
+    mask = values != 0
+    idx = game_idx[mask]
+    counts = np.bincount(idx, minlength=n_games)
+    sums = np.bincount(idx, weights=values[mask], minlength=n_games)
+    means = np.divide(sums, counts, out=np.zeros(n_games), where=counts > 0)
+    return means, counts
+
+
+def _fill_consensus(games: List["GameOdds"]):
+    """
+    Compute consensus spread / total / home implied prob for a whole slate at once.
+    Book lines are flattened into float64 columns with a game index, so each
+    consensus is one masked bincount instead of a Python pass per game per access.
+    """
+    n_games = len(games)
+    n_lines = sum(len(g.books) for g in games)
+    if not n_lines:
+        return
+
+    game_idx = np.repeat(np.arange(n_games), [len(g.books) for g in games])
+    lines = [b for g in games for b in g.books]
+    spreads = np.fromiter((b.spread_home for b in lines), dtype=np.float64, count=n_lines)
+    totals = np.fromiter((b.total for b in lines), dtype=np.float64, count=n_lines)
+    mls = np.fromiter((b.ml_home for b in lines), dtype=np.float64, count=n_lines)
+
+    spread_means, _ = _nonzero_means(spreads, game_idx, n_games)
+    total_means, _ = _nonzero_means(totals, game_idx, n_games)
+    ml_means, ml_counts = _nonzero_means(mls, game_idx, n_games)
+
+    # Same as GameOdds.implied_probability(int(avg_ml)), 0.5 when no moneylines
+    ml = np.trunc(ml_means)
+    ml_abs = np.abs(ml)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        probs = np.where(ml > 0, 100 / (ml + 100), ml_abs / (ml_abs + 100))
+    probs = np.where(ml_counts > 0, probs, 0.5)
+
+    for g, spread, total, prob in zip(games, spread_means.tolist(), total_means.tolist(), probs.tolist()):
+        g._consensus_spread_home = spread
+        g._consensus_total = total
+        g._home_implied_prob = prob
 
 
 # Map sport keys from The Odds API to our internal names
@@ -101,12 +199,26 @@ class OddsClient:
             print(f"{g.away_team} @ {g.home_team} | Spread: {g.consensus_spread_home}")
     """
 
+    # One pooled keep-alive session shared by every OddsClient in the process
+    # (each MatchupAnalyzer builds its own client)
+    _shared_session = build_session()
+
     def __init__(self):
         if not ODDS_API_KEY:
             print("[ODDS] WARNING: No ODDS_API_KEY set. Set env var ODDS_API_KEY.")
-        self.session = requests.Session()
+        self.session = OddsClient._shared_session
+        self._disk = DiskCache(HTTP_CACHE_DIR, HTTP_CACHE_MAX_AGE)
         self._remaining_requests = None
 
+    def _cache_ttl(self, remaining: Optional[str]) -> float:
+        """Longer reuse window once the API quota is running low"""
+        try:
+            if remaining is not None and int(float(remaining)) <= ODDS_LOW_QUOTA:
+                return ODDS_CACHE_TTL_LOW_QUOTA
+        except ValueError:
+            pass
+        return ODDS_CACHE_TTL
+
     def get_odds(self, sport: str = "nba") -> List[GameOdds]:
         """
         Get current odds for all games in a sport.
@@ -128,6 +240,16 @@ class OddsClient:
             "oddsFormat": "american",
         }
 
+        # Keyed on sport + markets/bookmakers — never on the API key
+        cache_params = {k: v for k, v in params.items() if k != "apiKey"}
+        cached = self._disk.get(url, cache_params, max_age=None)
+        if cached is not None:
+            remaining = cached.get("remaining")
+            if time.time() - cached.get("fetched", 0) <= self._cache_ttl(remaining):
+                if self._remaining_requests is None:
+                    self._remaining_requests = remaining
+                return self._parse_odds(cached.get("data", []), sport)
+
         try:
             resp = self.session.get(url, params=params, timeout=30)
             resp.raise_for_status()
@@ -137,11 +259,17 @@ class OddsClient:
             if self._remaining_requests:
                 print(f"[ODDS] Requests remaining: {self._remaining_requests}")
 
-            data = resp.json()
+            data = json_loads(resp.content)
         except Exception as e:
             print(f"[ODDS] Error fetching {sport}: {e}")
             return []
 
+        # Stale lines are worse than none, so a failed fetch never falls back to this
+        self._disk.set(url, cache_params, {
+            "fetched": time.time(),
+            "remaining": self._remaining_requests,
+            "data": data,
+        })
         return self._parse_odds(data, sport)
 
     def _parse_odds(self, data: list, sport: str) -> List[GameOdds]:
@@ -153,12 +281,15 @@ class OddsClient:
                 game_id=event.get("id", ""),
                 sport=sport,
                 commence_time=event.get("commence_time", ""),
-                home_team=event.get("home_team", ""),
-                away_team=event.get("away_team", ""),
+                # Interned: team names are dict keys downstream (name -> abbr)
+                home_team=sys.intern(event.get("home_team", "")),
+                away_team=sys.intern(event.get("away_team", "")),
             )
+            home_team = event.get("home_team")   # hoisted: compared against every outcome below
+            books = game.books
 
             for bookmaker in event.get("bookmakers", []):
-                book_name = bookmaker.get("key", "")
+                book_name = sys.intern(bookmaker.get("key", ""))
                 book_line = BookLine(
                     bookmaker=book_name,
                     spread_home=0, spread_away=0,
@@ -174,7 +305,7 @@ class OddsClient:
 
                     if mkey == "spreads":
                         for o in outcomes:
-                            if o.get("name") == event.get("home_team"):
+                            if o.get("name") == home_team:
                                 book_line.spread_home = o.get("point", 0)
                                 book_line.spread_home_price = o.get("price", 0)
                             else:
@@ -191,15 +322,16 @@ class OddsClient:
 
                     elif mkey == "h2h":
                         for o in outcomes:
-                            if o.get("name") == event.get("home_team"):
+                            if o.get("name") == home_team:
                                 book_line.ml_home = o.get("price", 0)
                             else:
                                 book_line.ml_away = o.get("price", 0)
 
-                game.books.append(book_line)
+                books.append(book_line)
 
             games.append(game)
 
+        _fill_consensus(games)
         return games
 
     @property
@@ -8,11 +8,15 @@ Production guardrails:
   - Input validation (NaN/None/absurd values caught)
   - Anomaly logging for debugging
 """
-from typing import Dict, Optional, List, Tuple
+from typing import Dict, Optional, List, Sequence, Tuple
 from dataclasses import dataclass
+from heapq import nlargest
+from operator import attrgetter
 import math
 import logging
 
+import numpy as np
+
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 from config import NBA_THRESHOLDS, NCAAB_THRESHOLDS, get_confidence_tier, EdgeThresholds
@@ -30,7 +34,7 @@ MIN_TOTAL = 110.0               # No realistic total below 150
 MAX_INJURY_IMPACT = 12.0        # Injury adjustment cap
 
 
-@dataclass
+@dataclass(slots=True)
 class EdgeResult:
     """Complete edge analysis for a single game"""
     # Teams
@@ -112,6 +116,9 @@ class EdgeCalculator:
     def __init__(self, sport: str = "nba"):
         self.sport = sport
         self.thresholds = NBA_THRESHOLDS if sport == "nba" else NCAAB_THRESHOLDS
+        self._min_edge = self.thresholds.min_edge_points   # thresholds are frozen
+        # 10^(spread/k) == exp(spread * ln10/k) — see _spread_to_win_prob
+        self._win_prob_scale = math.log(10) / (8.0 if sport == "nba" else 9.5)
 
     def _spread_to_win_prob(self, spread: float) -> float:
         """
@@ -124,8 +131,8 @@ class EdgeCalculator:
         # Logistic function: P(win) ≈ 1 / (1 + 10^(spread / k))
         # k ≈ 8.0 for NBA (each point ≈ ~3% win probability shift)
         # k ≈ 9.5 for NCAAB (more variance)
-        k = 8.0 if self.sport == "nba" else 9.5
-        return 1.0 / (1.0 + math.pow(10, spread / k))
+        # Evaluated as exp(spread * ln10/k) with ln10/k precomputed in __init__
+        return 1.0 / (1.0 + math.exp(spread * self._win_prob_scale))
 
     def _compute_ev(self, model_prob: float, market_prob: float) -> float:
         """
@@ -168,14 +175,8 @@ class EdgeCalculator:
 
         # ── EDGE CAPPING (ANOMALY GUARD) ──
         if abs(spread_edge) > MAX_EDGE_POINTS:
-            logger.warning(
-                f"EDGE ANOMALY: {away_rating.team_abbr}@{home_rating.team_abbr} | "
-                f"Model={model_spread_home:.1f} Market={market_spread_home:.1f} Edge={spread_edge:.1f} — QUARANTINED"
-            )
-            return self._quarantined_result(
-                away_rating, home_rating,
-                f"Edge {spread_edge:.1f} exceeds cap ({MAX_EDGE_POINTS}). Likely data error."
-            )
+            return self._edge_anomaly(away_rating, home_rating, model_spread_home,
+                                      market_spread_home, spread_edge)
 
         # Total edge
         total_edge = model_total - market_total
@@ -194,9 +195,111 @@ class EdgeCalculator:
             market_away_prob = 1 - market_win_prob_home
             ev_pct = self._compute_ev(model_away_prob, market_away_prob)
 
+        return self._build_result(
+            away_rating, home_rating, model_spread_home, model_total,
+            market_spread_home, market_total, home_implied_prob,
+            spread_edge, total_edge, model_win_prob_home, ev_pct,
+            injury_impact, injury_summary_away, injury_summary_home,
+        )
+
+    def compute_edges_batch(
+        self,
+        away_ratings: Sequence[PowerRating],
+        home_ratings: Sequence[PowerRating],
+        model_spread_home: Sequence[float],
+        model_total: Sequence[float],
+        market_spread_home: Sequence[float],
+        market_total: Sequence[float],
+        home_implied_prob: Sequence[float],
+        injury_impact: Sequence[float],
+        injury_summary_away: Sequence[str],
+        injury_summary_home: Sequence[str],
+    ) -> List[EdgeResult]:
+        """
+        compute_edge over a whole slate. Arguments are parallel sequences,
+        one entry per game; results come back in the same order.
+
+        Validation, edge capping, win probability and EV run as NumPy masks
+        over all games at once. Rows a mask flags fall back to the scalar
+        _validate_inputs for their error message. Same results as calling
+        compute_edge per game (win probability can differ in the last ulp).
+        """
+        n = len(away_ratings)
+        if not n:
+            return []
+
+        ms, mt, mks, mkt, ip, inj = (
+            np.asarray(v, dtype=np.float64)   # None -> NaN, caught by the NaN mask
+            for v in (model_spread_home, model_total, market_spread_home,
+                      market_total, home_implied_prob, injury_impact)
+        )
+        away_net = np.fromiter((r.weighted_net for r in away_ratings), dtype=np.float64, count=n)
+        home_net = np.fromiter((r.weighted_net for r in home_ratings), dtype=np.float64, count=n)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # Superset of _validate_inputs — flagged rows get the exact scalar check
+            suspect = (
+                np.isnan(ms) | np.isnan(mks) | np.isnan(mt) | np.isnan(mkt)
+                | (np.abs(ms) > MAX_SPREAD_ABS) | (np.abs(mks) > MAX_SPREAD_ABS)
+                | ((mt > 0) & ((mt > MAX_TOTAL) | (mt < MIN_TOTAL)))
+                | (ip < 0.01) | (ip > 0.99)
+                | (np.abs(inj) > MAX_INJURY_IMPACT)
+                | (np.abs(away_net) > 25) | (np.abs(home_net) > 25)
+            )
+
+            spread_edge = ms - mks
+            capped = np.abs(spread_edge) > MAX_EDGE_POINTS
+            total_edge = mt - mkt
+
+            p_home = 1.0 / (1.0 + np.exp(ms * self._win_prob_scale))
+            q_home = np.maximum(ip, 0.01)
+            home_side = spread_edge < 0
+            model_p = np.where(home_side, p_home, 1 - p_home)
+            market_p = np.where(home_side, q_home, 1 - q_home)
+            ev = np.where(market_p <= 0, 0.0, (model_p / market_p - 1) * 100)
+
+        spread_edge, total_edge, p_home, ev = (
+            spread_edge.tolist(), total_edge.tolist(), p_home.tolist(), ev.tolist()
+        )
+
+        results = []
+        for i in range(n):
+            away_rating, home_rating = away_ratings[i], home_ratings[i]
+
+            if suspect[i]:
+                validation_error = self._validate_inputs(
+                    model_spread_home[i], model_total[i], market_spread_home[i],
+                    market_total[i], home_implied_prob[i], injury_impact[i],
+                    away_rating, home_rating
+                )
+                if validation_error:
+                    logger.warning(f"Input validation failed: {away_rating.team_abbr}@{home_rating.team_abbr} — {validation_error}")
+                    results.append(self._quarantined_result(away_rating, home_rating, validation_error))
+                    continue
+
+            if capped[i]:
+                results.append(self._edge_anomaly(away_rating, home_rating, model_spread_home[i],
+                                                  market_spread_home[i], spread_edge[i]))
+                continue
+
+            results.append(self._build_result(
+                away_rating, home_rating, model_spread_home[i], model_total[i],
+                market_spread_home[i], market_total[i], home_implied_prob[i],
+                spread_edge[i], total_edge[i], p_home[i], round(ev[i], 2),
+                injury_impact[i], injury_summary_away[i], injury_summary_home[i],
+            ))
+        return results
+
+    def _build_result(self, away_rating: PowerRating, home_rating: PowerRating,
+                      model_spread_home, model_total, market_spread_home, market_total,
+                      home_implied_prob, spread_edge, total_edge, model_win_prob_home,
+                      ev_pct, injury_impact, injury_summary_away, injury_summary_home) -> EdgeResult:
+        """Play side, confidence and the final EdgeResult for a validated, uncapped game"""
+        sport = self.sport
+
         # Determine play side
         edge_abs = abs(spread_edge)
-        is_playable = edge_abs >= self.thresholds.min_edge_points
+        is_playable = edge_abs >= self._min_edge
 
         if not is_playable:
             play_side = "NO PLAY"
@@ -207,12 +310,12 @@ class EdgeCalculator:
             # Model has home LESS favored than market → away undervalued
             play_side = "AWAY"
 
-        confidence = get_confidence_tier(edge_abs, self.sport)
+        confidence = get_confidence_tier(edge_abs, sport)
 
         return EdgeResult(
             away_team=away_rating.team_abbr,
             home_team=home_rating.team_abbr,
-            sport=self.sport,
+            sport=sport,
             away_rating=away_rating.weighted_net,
             home_rating=home_rating.weighted_net,
             away_trend=away_rating.trend_label,
@@ -236,6 +339,18 @@ class EdgeCalculator:
             home_regime_shift=home_rating.regime_shift,
         )
 
+    def _edge_anomaly(self, away_rating: PowerRating, home_rating: PowerRating,
+                      model_spread_home, market_spread_home, spread_edge) -> EdgeResult:
+        """Log and quarantine a game whose edge exceeds MAX_EDGE_POINTS"""
+        logger.warning(
+            f"EDGE ANOMALY: {away_rating.team_abbr}@{home_rating.team_abbr} | "
+            f"Model={model_spread_home:.1f} Market={market_spread_home:.1f} Edge={spread_edge:.1f} — QUARANTINED"
+        )
+        return self._quarantined_result(
+            away_rating, home_rating,
+            f"Edge {spread_edge:.1f} exceeds cap ({MAX_EDGE_POINTS}). Likely data error."
+        )
+
     def _validate_inputs(self, model_spread, model_total, market_spread,
                          market_total, implied_prob, injury_impact,
                          away_rating, home_rating) -> Optional[str]:
@@ -243,11 +358,15 @@ class EdgeCalculator:
         Validate all inputs before computing edge.
         Returns error string if invalid, None if clean.
         """
-        # NaN / None checks
-        for name, val in [("model_spread", model_spread), ("market_spread", market_spread),
-                          ("model_total", model_total), ("market_total", market_total)]:
-            if val is None or (isinstance(val, float) and math.isnan(val)):
-                return f"{name} is NaN/None"
+        # NaN / None checks (v != v is True only for NaN)
+        if model_spread is None or model_spread != model_spread:
+            return "model_spread is NaN/None"
+        if market_spread is None or market_spread != market_spread:
+            return "market_spread is NaN/None"
+        if model_total is None or model_total != model_total:
+            return "model_total is NaN/None"
+        if market_total is None or market_total != market_total:
+            return "market_total is NaN/None"
 
         # Spread sanity
         if abs(model_spread) > MAX_SPREAD_ABS:
@@ -304,11 +423,13 @@ class EdgeCalculator:
         )
 
 
+_EDGE_ABS = attrgetter("edge_abs")
+
+
 def rank_edges(edges: List[EdgeResult], max_plays: int = 5) -> List[EdgeResult]:
     """
     Rank and filter edges by strength.
     Returns top N playable edges sorted by absolute edge size.
     """
-    playable = [e for e in edges if e.is_playable]
-    playable.sort(key=lambda e: e.edge_abs, reverse=True)
-    return playable[:max_plays]
+    # Partial sort: O(n log k); ties keep input order like a stable sort would
+    return nlargest(max_plays, (e for e in edges if e.is_playable), key=_EDGE_ABS)
@@ -2,7 +2,10 @@
 Matchup Analyzer 
 Orchestrates all components: Data → Ratings → Edge → Output
 """
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import sys, os
 
@@ -30,6 +33,20 @@ NBA_NAME_TO_ABBR = {
     "Portland Trail Blazers": "POR", "Sacramento Kings": "SAC", "San Antonio Spurs": "SAS",
     "Toronto Raptors": "TOR", "Utah Jazz": "UTA", "Washington Wizards": "WAS",
 }
+# Interned keys: names from _parse_odds are interned too, so lookups compare by identity.
+# Read-only — the resolver below memoizes against it.
+NBA_NAME_TO_ABBR = MappingProxyType({sys.intern(name): abbr for name, abbr in NBA_NAME_TO_ABBR.items()})
+
+
+@lru_cache(maxsize=256)
+def _resolve_nba_abbr(full_name: str) -> str:
+    """Odds API team name -> NBA abbreviation; ~30 distinct inputs, so memoized"""
+    return NBA_NAME_TO_ABBR.get(full_name) or full_name[:3].upper()
+
+
+def _identity(full_name: str) -> str:
+    return full_name
+
 
 class MatchupAnalyzer:
     def __init__(self, sport: str = "nba", season: str = "2025-26"):
@@ -50,61 +67,84 @@ class MatchupAnalyzer:
 
         self._ratings: Dict[str, PowerRating] = {}
         self._games: List[GameOdds] = []
+        self._resolved: List[Tuple[str, str]] = []   # (away_abbr, home_abbr) per game in _games
 
-    def _resolve_team_abbr(self, full_name: str) -> str:
-        if self.sport == "nba":
-            return NBA_NAME_TO_ABBR.get(full_name, full_name[:3].upper())
-        return full_name
+        # Odds API name -> ratings key; the sport never changes, so pick the resolver once
+        # (NCAAB ratings are keyed by the full team name already)
+        self._resolve_team_abbr = _resolve_nba_abbr if sport == "nba" else _identity
 
     def refresh_data(self):
         """Pull fresh stats and odds data"""
+        # Stats and odds are independent network pulls — overlap them
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            fut_profiles = pool.submit(self.stats_client.get_all_team_profiles)
+            fut_odds = pool.submit(self.odds_client.get_odds, self.sport)
+            profiles = fut_profiles.result()
+            self._games = fut_odds.result()
+
         if self.sport == "nba":
-            profiles = self.stats_client.get_all_team_profiles()
             self._ratings = self.rating_engine.compute_nba_ratings(profiles)
         else:
-            profiles = self.stats_client.get_all_team_profiles()
             self._ratings = self.rating_engine.compute_ncaab_ratings(profiles)
 
-        self._games = self.odds_client.get_odds(self.sport)
+        resolve = self._resolve_team_abbr
+        self._resolved = [(resolve(g.away_team), resolve(g.home_team)) for g in self._games]
 
     def compute_all_edges(self, max_plays: int = 5) -> List[EdgeResult]:
         """The 'Handshake' function called by app.py"""
         self.refresh_data()
-        all_edges = []
 
-        for game in self._games:
-            away_abbr = self._resolve_team_abbr(game.away_team)
-            home_abbr = self._resolve_team_abbr(game.home_team)
-            
-            away_rating = self._ratings.get(away_abbr)
-            home_rating = self._ratings.get(home_abbr)
+        # Gather one row per rated game, then score the whole slate in one batch
+        cols = {k: [] for k in (
+            "away_ratings", "home_ratings", "model_spread_home", "model_total",
+            "market_spread_home", "market_total", "home_implied_prob",
+            "injury_impact", "injury_summary_away", "injury_summary_home",
+        )}
+
+        home_abbrs: List[str] = []
+
+        # Injury summaries are formatted once per team per refresh
+        summaries: Dict[str, str] = {}
+
+        def summary(abbr: str) -> str:
+            text = summaries.get(abbr)
+            if text is None:
+                text = summaries[abbr] = self.injury_tracker.get_summary(abbr)
+            return text
+
+        # All rating lookups in one pass up front; the loop below does no dict hits for them
+        ratings = self._ratings
+        lookups = [(ratings.get(a), ratings.get(h)) for a, h in self._resolved]
+        skipped: List[Tuple[str, str]] = []
 
+        for game, (away_abbr, home_abbr), (away_rating, home_rating) in zip(self._games, self._resolved, lookups):
             if not away_rating or not home_rating:
+                skipped.append((game.away_team, game.home_team))
                 continue
 
-            # Model projections
-            injury_adj = self.injury_tracker.get_matchup_impact(home_abbr, away_abbr)
-            model_spread = self.rating_engine.compute_model_spread(
-                team_a_rating=home_rating,
-                team_b_rating=away_rating,
-                home_team=home_abbr,
-                injury_adj=injury_adj,
-            )
-            model_total = self.rating_engine.compute_model_total(home_rating, away_rating)
-
-            # Compute the final edge
-            edge = self.edge_calc.compute_edge(
-                away_rating=away_rating,
-                home_rating=home_rating,
-                model_spread_home=model_spread,
-                model_total=model_total,
-                market_spread_home=game.consensus_spread_home,
-                market_total=game.consensus_total,
-                home_implied_prob=game.home_implied_prob,
-                injury_impact=injury_adj,
-                injury_summary_away=self.injury_tracker.get_summary(away_abbr),
-                injury_summary_home=self.injury_tracker.get_summary(home_abbr),
-            )
-            all_edges.append(edge)
-
-        return all_edges
+            cols["away_ratings"].append(away_rating)
+            cols["home_ratings"].append(home_rating)
+            cols["market_spread_home"].append(game.consensus_spread_home)
+            cols["market_total"].append(game.consensus_total)
+            cols["home_implied_prob"].append(game.home_implied_prob)
+            cols["injury_impact"].append(self.injury_tracker.get_matchup_impact(home_abbr, away_abbr))
+            cols["injury_summary_away"].append(summary(away_abbr))
+            cols["injury_summary_home"].append(summary(home_abbr))
+            home_abbrs.append(home_abbr)
+
+        # Unrated games are reported once, in a single line
+        if skipped:
+            shown = ", ".join(f"{a} @ {h}" for a, h in skipped[:5])
+            more = f" (+{len(skipped) - 5} more)" if len(skipped) > 5 else ""
+            print(f"[SKIP] {len(skipped)} games missing ratings: {shown}{more}")
+
+        # Model projections for the whole slate (home = team A)
+        cols["model_spread_home"], cols["model_total"] = self.rating_engine.compute_model_batch(
+            team_a_ratings=cols["home_ratings"],
+            team_b_ratings=cols["away_ratings"],
+            home_teams=home_abbrs,
+            injury_adjs=cols["injury_impact"],
+        )
+
+        # Compute the final edges
+        return self.edge_calc.compute_edges_batch(**cols)
@@ -1,9 +1,28 @@
-import requests
-import json
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 import config
+from data.http_client import build_session, json_dumps
+
+# Shared keep-alive session — alerts reuse the pooled connection to Discord
+_session = build_session()
+
+# Alerts are posted in the background so a slow webhook never stalls a refresh;
+# pending posts are flushed on interpreter exit
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="discord-alert")
+atexit.register(_executor.shutdown, wait=True)
+
+
+def _post_webhook(webhook_url: str, body: bytes):
+    try:
+        resp = _session.post(webhook_url, data=body,
+                             headers={"Content-Type": "application/json"}, timeout=5)
+        resp.raise_for_status()
+    except Exception as e:
+        print(f"[DISCORD] Alert failed: {e}")
+
 
 def send_sniper_alert(top_plays, parlay_odds="+264"):
-    """Sends the top 2 plays to your Discord channel via Webhook"""
+    """Sends the top 2 plays to your Discord channel via Webhook (non-blocking; returns the Future)"""
     if not top_plays or len(top_plays) < 2:
         return
 
@@ -26,4 +45,4 @@ def send_sniper_alert(top_plays, parlay_odds="+264"):
     # Use the Webhook URL from your Streamlit Secrets or config.py
     webhook_url = getattr(config, 'DISCORD_WEBHOOK_URL', None)
     if webhook_url:
-        requests.post(webhook_url, json=payload)
+        return _executor.submit(_post_webhook, webhook_url, json_dumps(payload))
@@ -10,9 +10,11 @@ The weighted rating formula:
 
 Then model spread = (Team_A_Rating - Team_B_Rating) + home_court + injury_adjustment
 """
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 from config import NBA_WEIGHTS, NCAAB_WEIGHTS, HOME_COURT, RatingWeights
@@ -20,11 +22,11 @@ from data.nba_stats import TeamProfile, TeamMetrics
 from data.ncaab_stats import NCAABTeamProfile, NCAABTeamMetrics
 
 
-@dataclass
+@dataclass(slots=True)
 class PowerRating:
-    """Computed power rating for a team"""
+    """Computed power rating for a team (full precision; format at display time)"""
     team_name: str
-    team_abbr: str
+    team_abbr: str           # uppercase (NBA API abbreviation / NCAAB name prefix)
     sport: str
 
     # Component ratings
@@ -78,6 +80,40 @@ class PowerRating:
             return f"Shift down ({self.regime_shift:.1f})"
 
 
+def _window_matrix(windows: Sequence[tuple], fields: Tuple[str, ...]) -> np.ndarray:
+    """
+    Stack per-team metrics into a float64 (team, metric, window) array.
+    windows[i] holds one team's metrics objects, oldest-horizon first
+    (season, last_15, ...); a missing window carries the previous one forward.
+    """
+    n_teams, n_windows = len(windows), len(windows[0]) if windows else 0
+    M = np.full((n_teams, len(fields), n_windows), np.nan)
+    present = np.zeros((n_teams, n_windows), dtype=bool)
+    for i, team_windows in enumerate(windows):
+        for j, m in enumerate(team_windows):
+            if m:
+                M[i, :, j] = [getattr(m, f) for f in fields]
+                present[i, j] = True
+
+    # Fallback chain season -> L15 -> L5 -> L1, one column at a time for every team and metric.
+    # Keyed on the presence mask rather than NaN so a NaN stat in a real window stays put.
+    for j in range(1, n_windows):
+        M[:, :, j] = np.where(present[:, None, j], M[:, :, j], M[:, :, j - 1])
+    return M
+
+
+def _weighted_sum(M: np.ndarray, weights: Sequence[float]) -> np.ndarray:
+    """
+    (team, metric, window) x per-window weights -> (team, metric).
+    Summed window by window in order, so results match the scalar
+    w0*x0 + w1*x1 + ... exactly (a BLAS dot may reorder/fuse).
+    """
+    out = M[:, :, 0] * weights[0]
+    for j in range(1, len(weights)):
+        out = out + M[:, :, j] * weights[j]
+    return out
+
+
 class RatingEngine:
     """
     Computes time-weighted power ratings.
@@ -105,9 +141,7 @@ class RatingEngine:
 
     def __init__(self, nba_weights: RatingWeights = None, ncaab_weights: RatingWeights = None):
         self.nba_weights = nba_weights or NBA_WEIGHTS
-        self.ncaab_weights = ncaab_weights or NCAAB_WEIGHTS
-        self.nba_weights.validate()
-        self.ncaab_weights.validate()
+        self.ncaab_weights = ncaab_weights or NCAAB_WEIGHTS  # validated at construction
 
     # ─────────────────────────────────────────
     # NBA RATINGS
@@ -115,47 +149,26 @@ class RatingEngine:
 
     def compute_nba_ratings(self, profiles: Dict[str, TeamProfile]) -> Dict[str, PowerRating]:
         """Compute weighted power ratings for all NBA teams"""
-        ratings = {}
         w = self.nba_weights
+        teams = [(abbr, prof) for abbr, prof in profiles.items() if prof.season]
+        if not teams:
+            return {}
+
+        # (team, metric, window) — a missing window falls back to the one before it
+        M = _window_matrix(
+            [(p.season, p.last_15, p.last_5, p.last_1) for _, p in teams],
+            ("net_rating", "off_rating", "def_rating", "pace"),
+        )
+        # Weighted composites for all teams and all four metrics at once
+        weighted = _weighted_sum(M, (w.season, w.last_15, w.last_5, w.last_game)).tolist()
+        nets = M[:, 0, :].tolist()
 
-        for abbr, prof in profiles.items():
+        # teams only holds profiles with a season window, so prof.season is always set below
+        ratings = {}
+        for (abbr, prof), (s_net, l15_net, l5_net, l1_net), (weighted_net, weighted_off, weighted_def, weighted_pace) \
+                in zip(teams, nets, weighted):
             s = prof.season
             l15 = prof.last_15
-            l5 = prof.last_5
-            l1 = prof.last_1
-
-            if not s:
-                continue
-
-            # Net ratings per window (fallback to season if missing)
-            s_net = s.net_rating if s else 0
-            l15_net = l15.net_rating if l15 else s_net
-            l5_net = l5.net_rating if l5 else l15_net
-            l1_net = l1.net_rating if l1 else l5_net
-
-            # Offensive ratings
-            s_off = s.off_rating if s else 0
-            l15_off = l15.off_rating if l15 else s_off
-            l5_off = l5.off_rating if l5 else l15_off
-            l1_off = l1.off_rating if l1 else l5_off
-
-            # Defensive ratings
-            s_def = s.def_rating if s else 0
-            l15_def = l15.def_rating if l15 else s_def
-            l5_def = l5.def_rating if l5 else l15_def
-            l1_def = l1.def_rating if l1 else l5_def
-
-            # Pace
-            s_pace = s.pace if s else 0
-            l15_pace = l15.pace if l15 else s_pace
-            l5_pace = l5.pace if l5 else l15_pace
-            l1_pace = l1.pace if l1 else l5_pace
-
-            # Weighted composites
-            weighted_net = (w.season * s_net) + (w.last_15 * l15_net) + (w.last_5 * l5_net) + (w.last_game * l1_net)
-            weighted_off = (w.season * s_off) + (w.last_15 * l15_off) + (w.last_5 * l5_off) + (w.last_game * l1_off)
-            weighted_def = (w.season * s_def) + (w.last_15 * l15_def) + (w.last_5 * l5_def) + (w.last_game * l1_def)
-            weighted_pace = (w.season * s_pace) + (w.last_15 * l15_pace) + (w.last_5 * l5_pace) + (w.last_game * l1_pace)
 
             # Trend detection
             trending_up = l15_net > s_net
@@ -167,19 +180,19 @@ class RatingEngine:
                 team_name=prof.team_name,
                 team_abbr=abbr,
                 sport="nba",
-                season_net=round(s_net, 2),
-                last_15_net=round(l15_net, 2),
-                last_5_net=round(l5_net, 2),
-                last_1_net=round(l1_net, 2),
-                weighted_net=round(weighted_net, 2),
-                weighted_off=round(weighted_off, 2),
-                weighted_def=round(weighted_def, 2),
-                weighted_pace=round(weighted_pace, 2),
+                season_net=s_net,
+                last_15_net=l15_net,
+                last_5_net=l5_net,
+                last_1_net=l1_net,
+                weighted_net=weighted_net,
+                weighted_off=weighted_off,
+                weighted_def=weighted_def,
+                weighted_pace=weighted_pace,
                 trending_up=trending_up,
                 hot_streak=hot_streak,
                 cooling_off=cooling_off,
-                regime_shift=round(regime_shift, 2),
-                season_record=s.record if s else "",
+                regime_shift=regime_shift,
+                season_record=s.record,
                 recent_record=l15.record if l15 else "",
             )
 
@@ -191,45 +204,25 @@ class RatingEngine:
 
     def compute_ncaab_ratings(self, profiles: Dict[str, NCAABTeamProfile]) -> Dict[str, PowerRating]:
         """Compute weighted power ratings for all NCAAB teams"""
-        ratings = {}
         w = self.ncaab_weights
+        teams = [(name, prof) for name, prof in profiles.items() if prof.season]
+        if not teams:
+            return {}
 
-        for name, prof in profiles.items():
+        M = _window_matrix(
+            [(p.season, p.last_15, p.last_5) for _, p in teams],
+            ("adj_net", "adj_off", "adj_def", "tempo"),
+        )
+        # NCAAB doesn't always have last_1 granularity, so use 3 windows
+        weighted = _weighted_sum(M, (w.season, w.last_15, w.last_5 + w.last_game)).tolist()
+        nets = M[:, 0, :].tolist()
+
+        ratings = {}
+        for (name, prof), (s_net, l15_net, l5_net), (weighted_net, weighted_off, weighted_def, weighted_pace) \
+                in zip(teams, nets, weighted):
             s = prof.season
-            l15 = prof.last_15
-            l5 = prof.last_5
             l1 = prof.last_1
 
-            if not s:
-                continue
-
-            # Net ratings
-            s_net = s.adj_net if s else 0
-            l15_net = l15.adj_net if l15 else s_net
-            l5_net = l5.adj_net if l5 else l15_net
-            l1_net = l1.adj_net if l1 else l5_net
-
-            # Off/Def
-            s_off = s.adj_off if s else 0
-            l15_off = l15.adj_off if l15 else s_off
-            l5_off = l5.adj_off if l5 else l15_off
-
-            s_def = s.adj_def if s else 0
-            l15_def = l15.adj_def if l15 else s_def
-            l5_def = l5.adj_def if l5 else l15_def
-
-            # Tempo
-            s_tempo = s.tempo if s else 0
-            l15_tempo = l15.tempo if l15 else s_tempo
-            l5_tempo = l5.tempo if l5 else l15_tempo
-
-            # Weighted
-            # NCAAB doesn't always have last_1 granularity, so use 3 windows
-            weighted_net = (w.season * s_net) + (w.last_15 * l15_net) + ((w.last_5 + w.last_game) * l5_net)
-            weighted_off = (w.season * s_off) + (w.last_15 * l15_off) + ((w.last_5 + w.last_game) * l5_off)
-            weighted_def = (w.season * s_def) + (w.last_15 * l15_def) + ((w.last_5 + w.last_game) * l5_def)
-            weighted_pace = (w.season * s_tempo) + (w.last_15 * l15_tempo) + ((w.last_5 + w.last_game) * l5_tempo)
-
             trending_up = l15_net > s_net
             hot_streak = l5_net > l15_net > s_net
             cooling_off = l5_net < l15_net < s_net
@@ -239,19 +232,19 @@ class RatingEngine:
                 team_name=name,
                 team_abbr=name[:4].upper(),
                 sport="ncaab",
-                season_net=round(s_net, 2),
-                last_15_net=round(l15_net, 2),
-                last_5_net=round(l5_net, 2),
-                last_1_net=round(l1_net if l1 else l5_net, 2),
-                weighted_net=round(weighted_net, 2),
-                weighted_off=round(weighted_off, 2),
-                weighted_def=round(weighted_def, 2),
-                weighted_pace=round(weighted_pace, 2),
+                season_net=s_net,
+                last_15_net=l15_net,
+                last_5_net=l5_net,
+                last_1_net=l1.adj_net if l1 else l5_net,
+                weighted_net=weighted_net,
+                weighted_off=weighted_off,
+                weighted_def=weighted_def,
+                weighted_pace=weighted_pace,
                 trending_up=trending_up,
                 hot_streak=hot_streak,
                 cooling_off=cooling_off,
-                regime_shift=round(regime_shift, 2),
-                season_record=s.record if s else "",
+                regime_shift=regime_shift,
+                season_record=s.record,
             )
 
         return ratings
@@ -260,6 +253,53 @@ class RatingEngine:
     # MODEL SPREAD COMPUTATION
     # ─────────────────────────────────────────
 
+    def compute_model(
+        self,
+        team_a_rating: PowerRating,
+        team_b_rating: PowerRating,
+        home_team: str,
+        injury_adj: float = 0.0,
+        rest_adj: float = 0.0,
+        hca: Optional[float] = None,
+    ) -> Tuple[float, float]:
+        """
+        Model spread and total for one game in a single pass: (spread, total).
+        Each rating's fields are read once; see compute_model_spread and
+        compute_model_total for what the two numbers mean.
+        """
+        a_net, a_off, a_def, a_pace = (team_a_rating.weighted_net, team_a_rating.weighted_off,
+                                       team_a_rating.weighted_def, team_a_rating.weighted_pace)
+        b_net, b_off, b_def, b_pace = (team_b_rating.weighted_net, team_b_rating.weighted_off,
+                                       team_b_rating.weighted_def, team_b_rating.weighted_pace)
+        if hca is None:
+            hca = HOME_COURT.get(team_a_rating.sport, 2.5)
+
+        # Base spread from rating difference
+        raw_spread = a_net - b_net
+
+        # Home court (rating abbreviations are stored uppercase)
+        home_team = home_team.upper()
+        if home_team == team_a_rating.team_abbr:
+            raw_spread += hca
+        elif home_team == team_b_rating.team_abbr:
+            raw_spread -= hca
+
+        # Adjustments
+        raw_spread += injury_adj
+        raw_spread += rest_adj
+
+        # Average pace determines possessions
+        # Team A scores: their offense vs B's defense
+        # Team B scores: their offense vs A's defense
+        # Simplified: use weighted ratings as per-100-possession scores
+        # Scale by actual expected possessions (pace / 100)
+        pace_factor = (a_pace + b_pace) / 2 / 100.0
+
+        a_scores = (a_off + (200 - b_def)) / 2 * pace_factor
+        b_scores = (b_off + (200 - a_def)) / 2 * pace_factor
+
+        return round(raw_spread, 1), round(a_scores + b_scores, 1)
+
     def compute_model_spread(
         self,
         team_a_rating: PowerRating,
@@ -267,6 +307,7 @@ class RatingEngine:
         home_team: str,
         injury_adj: float = 0.0,
         rest_adj: float = 0.0,
+        hca: Optional[float] = None,
     ) -> float:
         """
         Compute model-projected spread.
@@ -280,24 +321,10 @@ class RatingEngine:
             home_team: abbreviation of team playing at home ("A" side or "B" side)
             injury_adj: injury differential from InjuryTracker (from team_a perspective)
             rest_adj: rest advantage (positive = team_a rested more)
+            hca: home court points; looked up from HOME_COURT by sport when omitted
         """
-        sport = team_a_rating.sport
-        hca = HOME_COURT.get(sport, 2.5)
-
-        # Base spread from rating difference
-        raw_spread = team_a_rating.weighted_net - team_b_rating.weighted_net
-
-        # Home court
-        if home_team.upper() == team_a_rating.team_abbr.upper():
-            raw_spread += hca
-        elif home_team.upper() == team_b_rating.team_abbr.upper():
-            raw_spread -= hca
-
-        # Adjustments
-        raw_spread += injury_adj
-        raw_spread += rest_adj
-
-        return round(raw_spread, 1)
+        return self.compute_model(team_a_rating, team_b_rating, home_team,
+                                  injury_adj, rest_adj, hca)[0]
 
     def compute_model_total(
         self,
@@ -308,16 +335,54 @@ class RatingEngine:
         Estimate total points based on pace and offensive/defensive efficiency.
         This is a simplified model — real totals models are more complex.
         """
-        # Average pace determines possessions
-        avg_pace = (team_a_rating.weighted_pace + team_b_rating.weighted_pace) / 2
+        return self.compute_model(team_a_rating, team_b_rating, home_team="")[1]
 
-        # Team A scores: their offense vs B's defense
-        # Team B scores: their offense vs A's defense
-        # Simplified: use weighted ratings as per-100-possession scores
-        # Scale by actual expected possessions (pace / 100)
-        pace_factor = avg_pace / 100.0
-
-        a_scores = (team_a_rating.weighted_off + (200 - team_b_rating.weighted_def)) / 2 * pace_factor
-        b_scores = (team_b_rating.weighted_off + (200 - team_a_rating.weighted_def)) / 2 * pace_factor
-
-        return round(a_scores + b_scores, 1)
+    def compute_model_batch(
+        self,
+        team_a_ratings: Sequence[PowerRating],
+        team_b_ratings: Sequence[PowerRating],
+        home_teams: Sequence[str],
+        injury_adjs: Sequence[float],
+    ) -> Tuple[List[float], List[float]]:
+        """
+        compute_model for a whole slate.
+        Arguments are parallel per-game sequences; returns (spreads, totals)
+        in the same order. The arithmetic runs as NumPy vector ops over all
+        games; results match the scalar methods exactly.
+        """
+        n = len(team_a_ratings)
+        if not n:
+            return [], []
+
+        def stack(ratings):
+            return np.array([(r.weighted_net, r.weighted_off, r.weighted_def, r.weighted_pace)
+                             for r in ratings], dtype=np.float64).T
+
+        a_net, a_off, a_def, a_pace = stack(team_a_ratings)
+        b_net, b_off, b_def, b_pace = stack(team_b_ratings)
+        # Home court looked up once per sport on the slate (normally just one)
+        hca_by_sport = {sport: HOME_COURT.get(sport, 2.5) for sport in {r.sport for r in team_a_ratings}}
+        if len(hca_by_sport) == 1:
+            hca = next(iter(hca_by_sport.values()))
+        else:
+            hca = np.fromiter((hca_by_sport[r.sport] for r in team_a_ratings), dtype=np.float64, count=n)
+        injury = np.asarray(injury_adjs, dtype=np.float64)
+
+        # Home court side per game: +1 team A home, -1 team B home, 0 neither matched
+        side = np.empty(n, dtype=np.int8)
+        for i, (a, b, home) in enumerate(zip(team_a_ratings, team_b_ratings, home_teams)):
+            home = home.upper()
+            side[i] = 1 if home == a.team_abbr else (-1 if home == b.team_abbr else 0)
+
+        raw = a_net - b_net
+        raw = np.where(side > 0, raw + hca, np.where(side < 0, raw - hca, raw))
+        raw = raw + injury
+
+        pace_factor = (a_pace + b_pace) / 2 / 100.0
+        a_scores = (a_off + (200 - b_def)) / 2 * pace_factor
+        b_scores = (b_off + (200 - a_def)) / 2 * pace_factor
+
+        # Python round(), not np.round — identical half-way handling to the scalar path
+        spreads = [round(x, 1) for x in raw.tolist()]
+        totals = [round(x, 1) for x in (a_scores + b_scores).tolist()]
+        return spreads, totals
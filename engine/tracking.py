@@ -9,18 +9,200 @@ Tracks:
   - Win rate by confidence tier
   - Units gained/lost
 """
+import copy
 import sqlite3
 import os
-from typing import Dict, List, Optional, Tuple
+import json
+import logging
+import threading
+import time
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-from config import DB_PATH
+from config import DB_PATH, REPORT_CACHE_TTL
+
+logger = logging.getLogger("edgeintel.tracking")
+
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",       # ~20 MB page cache
+    "PRAGMA mmap_size=268435456",     # 256 MB memory-mapped reads
+)
+
+# Confidence label (config.get_confidence_tier) -> integer tier stored alongside it
+TIER_MAP = {
+    "⚪ LOW": 0,
+    "⚡ MODERATE": 1,
+    "✅ STRONG": 2,
+    "🔥 HIGH": 3,
+}
+
+# Explicit projection in PickRecord field order (never SELECT *), with the nullable
+# columns coalesced in SQL, so each row tuple maps straight onto PickRecord(*row)
+_PICK_COLUMNS = """
+    id, timestamp, sport, away_team, home_team, play_side, bet_type,
+    line_taken, odds_taken, COALESCE(closing_line, 0) AS closing_line,
+    model_spread, market_spread, edge_points, confidence, units, result,
+    COALESCE(profit_units, 0) AS profit_units, COALESCE(clv, 0) AS clv,
+    COALESCE(notes, '') AS notes
+"""
+
+# Grades one pick in a single statement. CLV is positive when the line moved our way
+# after we took it; profit is in units at the American odds taken (0 for a push).
+_GRADE_SQL = """
+    UPDATE picks SET
+        closing_line = :closing_line,
+        result = :result,
+        clv = ROUND(:closing_line - line_taken, 2),
+        profit_units = ROUND(CASE :result
+            WHEN 'win' THEN units * (CASE WHEN odds_taken > 0 THEN odds_taken / 100.0
+                                          ELSE 100.0 / ABS(odds_taken) END)
+            WHEN 'loss' THEN -units
+            ELSE 0.0
+        END, 2)
+    WHERE id = :id
+"""
+
+# Rebuilds daily_summary rows from picks; {scope} narrows which (date, sport) rows
+_ROLLUP_SQL = """
+    INSERT INTO daily_summary (date, sport, total_picks, wins, losses, pushes,
+                               units_wagered, units_profit, roi_pct, avg_clv,
+                               clv_count, clv_sum, clv_positive)
+    SELECT substr(timestamp, 1, 10), sport, COUNT(*),
+           SUM(result = 'win'), SUM(result = 'loss'), SUM(result = 'push'),
+           TOTAL(units), TOTAL(profit_units),
+           CASE WHEN TOTAL(units) > 0 THEN TOTAL(profit_units) / TOTAL(units) * 100 ELSE 0 END,
+           COALESCE(AVG(NULLIF(clv, 0)), 0),
+           COUNT(NULLIF(clv, 0)), TOTAL(NULLIF(clv, 0)), COALESCE(SUM(clv > 0), 0)
+    FROM picks
+    WHERE result != 'pending' {scope}
+    GROUP BY 1, 2
+    ON CONFLICT (date, sport) DO UPDATE SET
+        total_picks = excluded.total_picks, wins = excluded.wins,
+        losses = excluded.losses, pushes = excluded.pushes,
+        units_wagered = excluded.units_wagered, units_profit = excluded.units_profit,
+        roi_pct = excluded.roi_pct, avg_clv = excluded.avg_clv,
+        clv_count = excluded.clv_count, clv_sum = excluded.clv_sum,
+        clv_positive = excluded.clv_positive
+"""
+# Refreshes only the days touched by the picks whose ids are given as one JSON array.
+# Recomputed rather than incremented, so re-grading a pick can't double count it.
+_ROLLUP_FOR_IDS_SQL = _ROLLUP_SQL.format(scope="""
+    AND (substr(timestamp, 1, 10), sport) IN (
+        SELECT substr(timestamp, 1, 10), sport FROM picks
+        WHERE id IN (SELECT value FROM json_each(?))
+    )
+""")
+
+# Reports spanning more days than this take their totals from daily_summary
+_ROLLUP_MIN_DAYS = 30
+
+
+def _summary_totals_query(by_sport: bool, by_days: bool) -> str:
+    """Report totals (same columns as the picks totals query) off daily_summary"""
+    sport = "AND sport = :sport" if by_sport else ""
+    days = "AND date > :cutoff_day" if by_days else ""
+    # With a window, the cutoff's own day only counts picks after the cutoff time
+    partial_day = f"""
+        UNION ALL
+        SELECT COUNT(*), SUM(result = 'win'), SUM(result = 'loss'), SUM(result = 'push'),
+               TOTAL(units), TOTAL(profit_units),
+               COUNT(NULLIF(clv, 0)), TOTAL(NULLIF(clv, 0)), SUM(clv > 0)
+        FROM picks
+        WHERE result != 'pending' {sport}
+          AND timestamp > :cutoff AND substr(timestamp, 1, 10) = :cutoff_day
+    """ if by_days else ""
+    return f"""
+        SELECT SUM(graded), SUM(wins), SUM(losses), SUM(pushes),
+               TOTAL(units_wagered), TOTAL(units_profit),
+               SUM(clv_count), TOTAL(clv_sum), SUM(clv_positive)
+        FROM (
+            SELECT total_picks AS graded, wins, losses, pushes, units_wagered, units_profit,
+                   clv_count, clv_sum, clv_positive
+            FROM daily_summary
+            WHERE 1 {sport} {days}
+            {partial_day}
+        )
+    """
+
+
+_SUMMARY_TOTALS_SQL = {
+    (by_sport, by_days): _summary_totals_query(by_sport, by_days)
+    for by_sport in (False, True) for by_days in (False, True)
+}
+
+
+def _report_queries(where: str) -> Tuple[str, str, str]:
+    """(totals, by-confidence, streak) report queries over the graded picks matching `where`"""
+    totals = f"""
+        SELECT COUNT(*),
+               SUM(result = 'win'), SUM(result = 'loss'), SUM(result = 'push'),
+               TOTAL(units), TOTAL(profit_units),
+               COUNT(NULLIF(clv, 0)), TOTAL(NULLIF(clv, 0)), SUM(clv > 0)
+        FROM picks {where}
+    """
+    # In order of each tier's first pick
+    # Grouped on the integer tier; a free-form label with no tier is its own group
+    by_confidence = f"""
+        SELECT MIN(confidence), COUNT(*), SUM(result = 'win'), TOTAL(profit_units)
+        FROM picks {where}
+        GROUP BY COALESCE(confidence_tier, confidence)
+        ORDER BY MIN(timestamp)
+    """
+    # Current streak as (result, length): the newest decided pick's result, and how many
+    # decided picks are newer than the latest one with a different result. Each step is
+    # an index walk from the newest pick that stops at its first match. The filter is
+    # spelled out in each step (not a shared CTE, which SQLite would materialize by
+    # scanning every match), so the caller binds the parameters three times.
+    decided = f"picks {where} AND result != 'push'"
+    streak = f"""
+        WITH latest AS (
+            SELECT result FROM {decided} ORDER BY timestamp DESC, id DESC LIMIT 1
+        ),
+        last_break AS (
+            SELECT timestamp, id FROM {decided}
+            AND result != (SELECT result FROM latest)
+            ORDER BY timestamp DESC, id DESC LIMIT 1
+        )
+        SELECT (SELECT result FROM latest), COUNT(*) FROM {decided}
+        AND (timestamp, id) > (SELECT COALESCE(MAX(timestamp), ''), COALESCE(MAX(id), 0)
+                               FROM last_break)
+    """
+    return totals, by_confidence, streak
+
+
+# Report SQL built once per filter combination, keyed by (sport given, days given);
+# parameters bind in that order (sport, then cutoff)
+_REPORT_SQL = {
+    (False, False): _report_queries("WHERE result != 'pending'"),
+    (True, False): _report_queries("WHERE result != 'pending' AND sport = ?"),
+    (False, True): _report_queries("WHERE result != 'pending' AND timestamp > ?"),
+    (True, True): _report_queries("WHERE result != 'pending' AND sport = ? AND timestamp > ?"),
+}
+
 
+@lru_cache(maxsize=32)
+def _cutoff_at(days: int, minute: int) -> str:
+    return (datetime.fromtimestamp(minute * 60) - timedelta(days=days)).isoformat()
 
-@dataclass
+
+def _cutoff_iso(days: int) -> str:
+    """
+    ISO timestamp `days` before the start of the current minute. Minute
+    resolution is plenty for day-scale windows, and lets repeated calls
+    within the minute reuse one string.
+    """
+    return _cutoff_at(days, int(time.time() // 60))
+
+
+@dataclass(slots=True)
 class PickRecord:
     id: int
     timestamp: str
@@ -77,50 +259,108 @@ class PickTracker:
     def __init__(self, db_path: str = None):
         self.db_path = db_path or DB_PATH
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        # One connection for the tracker's lifetime instead of a connect/close per call.
+        # Streamlit reruns on worker threads, so it is shared across threads and the lock
+        # serializes use (SQLite serializes writers anyway).
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        # (sport, days) -> (computed_at, report); cleared by every write
+        self._report_cache: Dict[Tuple[Optional[str], Optional[int]], Tuple[float, Dict]] = {}
         self._init_db()
 
+    def _connection(self) -> sqlite3.Connection:
+        """The shared connection, opened on first use (call with self._lock held)"""
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            # WAL + synchronous=NORMAL: commits skip the rollback-journal rewrite and most
+            # fsyncs, and readers don't block the writer. journal_mode sticks to the file;
+            # the rest are per-connection, so they're applied on every (re)open.
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        """Close the shared connection; the next call reopens it"""
+        with self._lock:
+            if self._conn is not None:
+                # Refresh planner statistics (ANALYZE where it's due) so the indexes get used
+                self._conn.execute("PRAGMA optimize")
+                self._conn.close()
+                self._conn = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def _init_db(self):
         """Create tables if they don't exist"""
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS picks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT NOT NULL,
-                sport TEXT NOT NULL,
-                away_team TEXT NOT NULL,
-                home_team TEXT NOT NULL,
-                play_side TEXT NOT NULL,
-                bet_type TEXT NOT NULL DEFAULT 'spread',
-                line_taken REAL NOT NULL,
-                odds_taken INTEGER NOT NULL DEFAULT -110,
-                closing_line REAL DEFAULT NULL,
-                model_spread REAL NOT NULL,
-                market_spread REAL NOT NULL,
-                edge_points REAL NOT NULL,
-                confidence TEXT NOT NULL,
-                units REAL NOT NULL DEFAULT 1.0,
-                result TEXT NOT NULL DEFAULT 'pending',
-                profit_units REAL DEFAULT 0.0,
-                clv REAL DEFAULT 0.0,
-                notes TEXT DEFAULT ''
-            )
-        """)
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS daily_summary (
-                date TEXT PRIMARY KEY,
-                sport TEXT,
-                total_picks INTEGER,
-                wins INTEGER,
-                losses INTEGER,
-                pushes INTEGER,
-                units_wagered REAL,
-                units_profit REAL,
-                roi_pct REAL,
-                avg_clv REAL
-            )
-        """)
-        conn.commit()
-        conn.close()
+        with self._lock:
+            conn = self._connection()
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS picks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TEXT NOT NULL,
+                    sport TEXT NOT NULL,
+                    away_team TEXT NOT NULL,
+                    home_team TEXT NOT NULL,
+                    play_side TEXT NOT NULL,
+                    bet_type TEXT NOT NULL DEFAULT 'spread',
+                    line_taken REAL NOT NULL,
+                    odds_taken INTEGER NOT NULL DEFAULT -110,
+                    closing_line REAL DEFAULT NULL,
+                    model_spread REAL NOT NULL,
+                    market_spread REAL NOT NULL,
+                    edge_points REAL NOT NULL,
+                    confidence TEXT NOT NULL,
+                    units REAL NOT NULL DEFAULT 1.0,
+                    result TEXT NOT NULL DEFAULT 'pending',
+                    profit_units REAL DEFAULT 0.0,
+                    clv REAL DEFAULT 0.0,
+                    notes TEXT DEFAULT '',
+                    confidence_tier INTEGER DEFAULT NULL
+                )
+            """)
+            # Databases from before confidence_tier: add it and fill it from the labels
+            if "confidence_tier" not in {c[1] for c in conn.execute("PRAGMA table_info(picks)")}:
+                conn.execute("ALTER TABLE picks ADD COLUMN confidence_tier INTEGER DEFAULT NULL")
+                conn.executemany("UPDATE picks SET confidence_tier = ? WHERE confidence = ?",
+                                 [(tier, label) for label, tier in TIER_MAP.items()])
+            # Graded-pick rollup per (pick date, sport), kept current on every grade.
+            # Early versions declared it keyed on date alone and never filled it, so that
+            # shape is dropped and rebuilt from picks.
+            summary_pk = [c[1] for c in conn.execute("PRAGMA table_info(daily_summary)") if c[5]]
+            if summary_pk == ["date"]:
+                conn.execute("DROP TABLE daily_summary")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS daily_summary (
+                    date TEXT NOT NULL,
+                    sport TEXT NOT NULL,
+                    total_picks INTEGER,      -- graded picks
+                    wins INTEGER,
+                    losses INTEGER,
+                    pushes INTEGER,
+                    units_wagered REAL,
+                    units_profit REAL,
+                    roi_pct REAL,
+                    avg_clv REAL,
+                    clv_count INTEGER,        -- picks with a nonzero CLV
+                    clv_sum REAL,
+                    clv_positive INTEGER,
+                    PRIMARY KEY (date, sport)
+                )
+            """)
+            if conn.execute("SELECT 1 FROM daily_summary LIMIT 1").fetchone() is None:
+                conn.execute(_ROLLUP_SQL.format(scope=""))
+            # Every read filters on result / timestamp / sport; by_confidence groups graded picks
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_picks_result ON picks(result)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_picks_timestamp ON picks(timestamp)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_picks_sport_ts ON picks(sport, timestamp)")
+            conn.execute("DROP INDEX IF EXISTS idx_picks_result_conf")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_picks_result_tier ON picks(result, confidence_tier)")
+            conn.commit()
 
     def log_pick(self, sport: str, away_team: str, home_team: str,
                  play_side: str, bet_type: str, line_taken: float,
@@ -128,23 +368,53 @@ class PickTracker:
                  edge_points: float, confidence: str, units: float = 1.0,
                  notes: str = "") -> int:
         """Log a new pick. Returns pick ID."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.execute("""
-            INSERT INTO picks (timestamp, sport, away_team, home_team, play_side,
-                             bet_type, line_taken, odds_taken, model_spread,
-                             market_spread, edge_points, confidence, units, notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        return self.log_picks([dict(
+            sport=sport, away_team=away_team, home_team=home_team,
+            play_side=play_side, bet_type=bet_type, line_taken=line_taken,
+            odds_taken=odds_taken, model_spread=model_spread, market_spread=market_spread,
+            edge_points=edge_points, confidence=confidence, units=units, notes=notes,
+        )])[0]
+
+    def log_picks(self, picks: List[Dict]) -> List[int]:
+        """
+        Log several picks in one transaction (one commit for the whole slate).
+        Each dict takes log_pick's keyword arguments; units and notes are optional.
+        Returns the new pick IDs, in order.
+        """
+        if not picks:
+            return []
+
+        rows = [(
             datetime.now().isoformat(),
-            sport, away_team, home_team, play_side, bet_type,
-            line_taken, odds_taken, model_spread, market_spread,
-            edge_points, confidence, units, notes,
-        ))
-        pick_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        print(f"[TRACKER] Logged pick #{pick_id}: {play_side} {home_team if play_side == 'HOME' else away_team} {line_taken}")
-        return pick_id
+            p["sport"], p["away_team"], p["home_team"], p["play_side"], p["bet_type"],
+            p["line_taken"], p["odds_taken"], p["model_spread"], p["market_spread"],
+            p["edge_points"], p["confidence"], p.get("units", 1.0), p.get("notes", ""),
+            TIER_MAP.get(p["confidence"]),
+        ) for p in picks]
+
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                # executemany binds row by row, so SQLite's bound-parameter limit never applies
+                conn.executemany("""
+                    INSERT INTO picks (timestamp, sport, away_team, home_team, play_side,
+                                     bet_type, line_taken, odds_taken, model_spread,
+                                     market_spread, edge_points, confidence, units, notes,
+                                     confidence_tier)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, rows)
+                # The write lock is held for the whole insert, so the new IDs are consecutive
+                last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+            self._report_cache.clear()
+
+        pick_ids = list(range(last_id - len(rows) + 1, last_id + 1))
+        if len(picks) == 1:
+            p = picks[0]
+            side_team = p["home_team"] if p["play_side"] == "HOME" else p["away_team"]
+            logger.info("Logged pick #%d: %s %s %s", last_id, p["play_side"], side_team, p["line_taken"])
+        else:
+            logger.info("Logged %d picks (#%d-#%d)", len(picks), pick_ids[0], last_id)
+        return pick_ids
 
     def update_result(self, pick_id: int, closing_line: float, result: str):
         """
@@ -155,61 +425,86 @@ class PickTracker:
             closing_line: the spread at game start (for CLV calculation)
             result: "win", "loss", or "push"
         """
-        conn = sqlite3.connect(self.db_path)
-
-        # Get the pick
-        row = conn.execute("SELECT * FROM picks WHERE id = ?", (pick_id,)).fetchone()
-        if not row:
-            print(f"[TRACKER] Pick #{pick_id} not found")
-            conn.close()
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                # Profit and CLV are computed by the UPDATE itself; the stored values are
+                # read back in the same transaction for the log line
+                found = conn.execute(_GRADE_SQL, {
+                    "id": pick_id, "closing_line": closing_line, "result": result,
+                }).rowcount
+                if found:
+                    profit, clv = conn.execute(
+                        "SELECT profit_units, clv FROM picks WHERE id = ?", (pick_id,)
+                    ).fetchone()
+                    conn.execute(_ROLLUP_FOR_IDS_SQL, (json.dumps([pick_id]),))
+            self._report_cache.clear()
+
+        if not found:
+            logger.warning("Pick #%d not found", pick_id)
             return
+        logger.info("Updated pick #%d: %s (%+.2fu, CLV: %+.1f)", pick_id, result, profit, clv)
+
+    def update_results_batch(self, updates: List[Tuple[int, float, str]]) -> int:
+        """
+        Grade many picks in one transaction (e.g. end of night).
+
+        Args:
+            updates: (pick_id, closing_line, result) per pick, as for update_result()
+
+        Returns the number of picks updated (unknown IDs are skipped).
+        """
+        if not updates:
+            return 0
+
+        # In id order so the UPDATEs walk the table's B-tree front to back
+        params = [
+            {"id": pick_id, "closing_line": closing_line, "result": result}
+            for pick_id, closing_line, result in sorted(updates, key=lambda u: u[0])
+        ]
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                updated = conn.executemany(_GRADE_SQL, params).rowcount
+                conn.execute(_ROLLUP_FOR_IDS_SQL, (json.dumps([p["id"] for p in params]),))
+            self._report_cache.clear()
 
-        line_taken = row[7]   # line_taken
-        odds_taken = row[8]   # odds_taken
-        units = row[14]       # units
-
-        # Calculate CLV (positive = we got a better line than close)
-        clv = closing_line - line_taken  # if line moved our way, CLV is positive
-
-        # Calculate profit
-        if result == "win":
-            if odds_taken > 0:
-                profit = units * (odds_taken / 100)
-            else:
-                profit = units * (100 / abs(odds_taken))
-        elif result == "loss":
-            profit = -units
-        else:  # push
-            profit = 0.0
-
-        conn.execute("""
-            UPDATE picks SET closing_line = ?, result = ?, profit_units = ?, clv = ?
-            WHERE id = ?
-        """, (closing_line, result, round(profit, 2), round(clv, 2), pick_id))
-        conn.commit()
-        conn.close()
-        print(f"[TRACKER] Updated pick #{pick_id}: {result} ({profit:+.2f}u, CLV: {clv:+.1f})")
+        logger.info("Graded %d of %d picks", updated, len(updates))
+        return updated
 
     def get_pending_picks(self) -> List[PickRecord]:
         """Get all picks that haven't been graded yet"""
-        return self._query_picks("WHERE result = 'pending'")
-
-    def get_recent_picks(self, days: int = 7) -> List[PickRecord]:
-        """Get picks from the last N days"""
-        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
-        return self._query_picks(f"WHERE timestamp > '{cutoff}' ORDER BY timestamp DESC")
-
-    def _query_picks(self, where_clause: str = "") -> List[PickRecord]:
-        conn = sqlite3.connect(self.db_path)
-        rows = conn.execute(f"SELECT * FROM picks {where_clause}").fetchall()
-        conn.close()
-        return [PickRecord(
-            id=r[0], timestamp=r[1], sport=r[2], away_team=r[3], home_team=r[4],
-            play_side=r[5], bet_type=r[6], line_taken=r[7], odds_taken=r[8],
-            closing_line=r[9] or 0, model_spread=r[10], market_spread=r[11],
-            edge_points=r[12], confidence=r[13], units=r[14], result=r[15],
-            profit_units=r[16] or 0, clv=r[17] or 0, notes=r[18] or "",
-        ) for r in rows]
+        return self._query_picks("WHERE result = 'pending' ORDER BY id")
+
+    def get_recent_picks(self, days: int = 7, limit: Optional[int] = None) -> List[PickRecord]:
+        """Get picks from the last N days, newest first (at most `limit` if given)"""
+        cutoff = _cutoff_iso(days)
+        picks = self._iter_picks("WHERE timestamp > ? ORDER BY timestamp DESC", (cutoff,))
+        return list(islice(picks, limit))
+
+    def _query_picks(self, where_clause: str = "", params: tuple = ()) -> List[PickRecord]:
+        return list(self._iter_picks(where_clause, params))
+
+    def _iter_picks(self, where_clause: str = "", params: tuple = (),
+                    chunk: int = 500) -> Iterator[PickRecord]:
+        """
+        Yield matching picks, fetched `chunk` rows at a time, so a caller that
+        stops early never materializes the rest of a long history.
+        """
+        with self._lock:
+            cursor = self._connection().cursor()
+            cursor.execute(f"SELECT {_PICK_COLUMNS} FROM picks {where_clause}", params)
+        try:
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(chunk)
+                if not rows:
+                    return
+                for row in rows:
+                    yield PickRecord(*row)
+        finally:
+            with self._lock:
+                cursor.close()
 
     def get_performance_report(self, sport: str = None, days: int = None) -> Dict:
         """
@@ -221,58 +516,65 @@ class PickTracker:
             avg_clv, clv_positive_rate,
             by_confidence (breakdown by tier),
             streak (current W/L streak)
+
+        Reports are reused for REPORT_CACHE_TTL seconds per (sport, days);
+        logging or grading a pick invalidates them. Callers get their own copy,
+        so editing a returned report never leaks into the cache.
         """
-        where_parts = ["result != 'pending'"]
+        key = (sport, days)
+        with self._lock:
+            hit = self._report_cache.get(key)
+            if hit is not None and time.monotonic() - hit[0] < REPORT_CACHE_TTL:
+                return copy.deepcopy(hit[1])
+            report = self._compute_performance_report(sport, days)
+            if len(self._report_cache) >= 32:     # only a few (sport, days) combos in practice
+                self._report_cache.clear()
+            self._report_cache[key] = (time.monotonic(), report)
+            return copy.deepcopy(report)
+
+    def _compute_performance_report(self, sport: Optional[str], days: Optional[int]) -> Dict:
+        # Bound parameters, never interpolated values; the SQL is one of the fixed
+        # _REPORT_SQL texts, so the connection's statement cache always reuses the plan
+        params = []
         if sport:
-            where_parts.append(f"sport = '{sport}'")
+            params.append(sport)
         if days:
-            cutoff = (datetime.now() - timedelta(days=days)).isoformat()
-            where_parts.append(f"timestamp > '{cutoff}'")
-
-        where = "WHERE " + " AND ".join(where_parts)
-        picks = self._query_picks(where + " ORDER BY timestamp ASC")
-
-        if not picks:
-            return {"total_picks": 0, "message": "No graded picks yet"}
+            cutoff = _cutoff_iso(days)
+            params.append(cutoff)
+        totals_sql, by_confidence_sql, streak_sql = _REPORT_SQL[bool(sport), bool(days)]
+
+        # Long ranges read the totals off the daily rollup (one row per day) instead of
+        # every pick; only the cutoff's partial day is aggregated from picks
+        if not days or days > _ROLLUP_MIN_DAYS:
+            totals_sql = _SUMMARY_TOTALS_SQL[bool(sport), bool(days)]
+            totals_params = {"sport": sport}
+            if days:
+                totals_params.update(cutoff=cutoff, cutoff_day=cutoff[:10])
+        else:
+            totals_params = params
+
+        # Aggregated in SQL — only summary rows (and the streak tail) come back to Python
+        with self._lock:
+            conn = self._connection()
+            (graded, wins, losses, pushes, units_wagered, units_profit,
+             clv_count, clv_sum, clv_positive) = conn.execute(totals_sql, totals_params).fetchone()
+
+            if not graded:
+                return {"total_picks": 0, "message": "No graded picks yet"}
+
+            # By confidence tier, in order of each tier's first pick
+            by_confidence = {
+                tier: {"picks": n, "wins": n_wins, "profit": profit}
+                for tier, n, n_wins, profit in conn.execute(by_confidence_sql, params)
+            }
+
+            # Current streak, computed entirely in SQL
+            streak_type, streak = conn.execute(streak_sql, params * 3).fetchone()
 
-        wins = sum(1 for p in picks if p.result == "win")
-        losses = sum(1 for p in picks if p.result == "loss")
-        pushes = sum(1 for p in picks if p.result == "push")
         total = wins + losses + pushes
-
-        units_wagered = sum(p.units for p in picks)
-        units_profit = sum(p.profit_units for p in picks)
         roi_pct = (units_profit / units_wagered * 100) if units_wagered > 0 else 0
-
-        clv_values = [p.clv for p in picks if p.clv != 0]
-        avg_clv = sum(clv_values) / len(clv_values) if clv_values else 0
-        clv_positive = sum(1 for c in clv_values if c > 0)
-        clv_rate = (clv_positive / len(clv_values) * 100) if clv_values else 0
-
-        # By confidence tier
-        by_confidence = {}
-        for p in picks:
-            tier = p.confidence
-            if tier not in by_confidence:
-                by_confidence[tier] = {"picks": 0, "wins": 0, "profit": 0.0}
-            by_confidence[tier]["picks"] += 1
-            if p.result == "win":
-                by_confidence[tier]["wins"] += 1
-            by_confidence[tier]["profit"] += p.profit_units
-
-        # Current streak
-        streak = 0
-        streak_type = ""
-        for p in reversed(picks):
-            if p.result == "push":
-                continue
-            if not streak_type:
-                streak_type = p.result
-                streak = 1
-            elif p.result == streak_type:
-                streak += 1
-            else:
-                break
+        avg_clv = clv_sum / clv_count if clv_count else 0
+        clv_rate = (clv_positive / clv_count * 100) if clv_count else 0
 
         return {
             "total_picks": total,